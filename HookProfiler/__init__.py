@@ -0,0 +1,135 @@
+import os
+from collections import deque
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List
+
+from unrealsdk import Log  # type: ignore
+
+from ..ModMenu import EnabledSaveType, Game, Mods, ModTypes, RegisterMod, SDKMod
+
+SampleCount: int = 1000
+
+# Checked by every wrapped hook, so turning the profiler off costs a single global lookup per call
+Profiling: bool = False
+
+
+class HookStats:
+    __slots__ = ("Calls", "TotalTime", "Exceptions", "Samples")
+
+    def __init__(self) -> None:
+        self.Calls: int = 0
+        self.TotalTime: float = 0.
+        self.Exceptions: int = 0
+        self.Samples: Deque[float] = deque(maxlen=SampleCount)
+
+    def Percentile(self, percentile: float) -> float:
+        if len(self.Samples) == 0:
+            return 0.
+        samples: List[float] = sorted(self.Samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
+
+
+Stats: Dict[str, HookStats] = {}
+
+
+def profile_hook(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Wraps a hook callback so its call count, wall time and exceptions get recorded under `name` while the
+    Hook Profiler mod is enabled. Mods should import this optionally and fall back to a no-op decorator.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not Profiling:
+                return func(*args, **kwargs)
+
+            stats: HookStats = Stats.get(name) or Stats.setdefault(name, HookStats())
+            start: float = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                stats.Exceptions += 1
+                raise
+            finally:
+                elapsed: float = perf_counter() - start
+                stats.Calls += 1
+                stats.TotalTime += elapsed
+                stats.Samples.append(elapsed)
+        return wrapper
+    return decorator
+
+
+def format_stats() -> List[str]:
+    lines: List[str] = [
+        f"{'Hook':<64}{'Calls':>10}{'Total ms':>12}{'p50 us':>10}{'p99 us':>10}{'Errors':>8}"
+    ]
+    for name, stats in sorted(Stats.items(), key=lambda item: item[1].TotalTime, reverse=True):
+        lines.append(
+            f"{name:<64}{stats.Calls:>10}{stats.TotalTime * 1000:>12.2f}"
+            f"{stats.Percentile(0.5) * 1000000:>10.1f}{stats.Percentile(0.99) * 1000000:>10.1f}"
+            f"{stats.Exceptions:>8}"
+        )
+    return lines
+
+
+class HookProfiler(SDKMod):
+    Name: str = "Hook Profiler"
+    Author: str = "LaryIsland"
+    Description: str = (
+        "<font size='26' color='#de5b00'>          Hook Profiler</font>\n\n"
+        "Records how often, and for how long, each profiled mod hook runs while enabled.\n\n"
+        "Press [D] to dump the results to the console and hook_profile.txt, and [R] to reset them."
+    )
+    Version: str = "1.0"
+
+    SupportedGames: Game = Game.BL2 | Game.TPS
+    Types: ModTypes = ModTypes.Utility
+    SaveEnabledState: EnabledSaveType = EnabledSaveType.NotSaved
+
+    SettingsInputs = SDKMod.SettingsInputs.copy()
+    SettingsInputs["D"] = "Dump"
+    SettingsInputs["R"] = "Reset"
+
+    def SettingsInputPressed(self, action: str) -> None:
+        if action == "Dump":
+            self.DumpStats()
+        elif action == "Reset":
+            Stats.clear()
+        else:
+            super().SettingsInputPressed(action)
+
+    def DumpStats(self) -> None:
+        lines: List[str] = format_stats()
+        for line in lines:
+            Log(f"[{self.Name}] {line}")
+        with open(os.path.join(os.path.dirname(__file__), "hook_profile.txt"), "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def Enable(self) -> None:
+        global Profiling
+        Profiling = True
+        super().Enable()
+
+    def Disable(self) -> None:
+        global Profiling
+        Profiling = False
+        super().Disable()
+
+
+instance = HookProfiler()
+
+if __name__ == "__main__":
+    Log(f"[{instance.Name}] Manually loaded")
+    for mod in Mods:
+        if mod.Name == instance.Name:
+            if mod.IsEnabled:
+                mod.Disable()
+            Mods.remove(mod)
+            Log(f"[{instance.Name}] Removed last instance")
+
+            # Fixes inspect.getfile()
+            instance.__class__.__module__ = mod.__class__.__module__
+            break
+
+RegisterMod(instance)
@@ -1,7 +1,12 @@
+import re
 import webbrowser
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from unrealsdk import (ConstructObject, FindObject, FStruct,  # type: ignore
-                       KeepAlive, LoadPackage, Log, UFunction, UObject)
+                       GetEngine, KeepAlive, LoadPackage, Log, UFunction,
+                       UObject)
 
 from ..ModMenu import (EnabledSaveType, Game, Hook, Mods, ModTypes,
                        RegisterMod, SDKMod)
@@ -12,12 +17,451 @@ except ImportError:
     webbrowser.open("https://bl-sdk.github.io/requirements/?mod=Melee%20Enhancement&Structs")
     raise
 
+try:
+    from ..ShieldRechargeTimer import Sampler as AttributeSampler
+except ImportError:
+    AttributeSampler = None
+
+try:
+    from .. import HookProfiler
+    from ..HookProfiler import profile_hook
+except ImportError:
+    HookProfiler = None
+
+    def profile_hook(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return lambda func: func
+
+
+AttributePattern = re.compile(r"(\w+)(?:\[(\d+)\])?")
+
+
+def FindAttribute(className: str, path: str) -> UObject:
+    # Shares Shield Recharge Timer's resolved attributes when it's installed
+    if AttributeSampler is not None:
+        return AttributeSampler.Resolve(className, path)
+    return FindObject(className, path)
+
+
+def LogTiming(message: str) -> None:
+    # Timings are always kept in PatchEngine.Timings, they're only written to the console while profiling
+    if HookProfiler is not None and HookProfiler.Profiling:
+        Log(f"[Melee Enhancement] {message}")
+
 
 def SetSkillDescription(PC, Skill: str, Desc: str) -> None:
     # Skill descriptions are set in this roundabout way as setting them directly causes a crash
     PC.ConsoleCommand(f"set {Skill} SkillDescription {Desc}")
 
 
+@lru_cache(maxsize=None)
+def SplitAttribute(attribute: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    # "Definitions[0].Interval" -> (("Definitions", 0), ("Interval", None))
+    return tuple(
+        (name, None if index is None else int(index))
+        for name, index in (AttributePattern.fullmatch(step).groups() for step in attribute.split("."))
+    )
+
+
+def GetAttribute(obj: Any, attribute: str) -> Any:
+    for name, index in SplitAttribute(attribute):
+        obj = getattr(obj, name)
+        if index is not None:
+            obj = obj[index]
+    return obj
+
+
+def SetAttribute(obj: Any, attribute: str, value: Any) -> None:
+    *steps, (name, index) = SplitAttribute(attribute)
+    for stepName, stepIndex in steps:
+        obj = getattr(obj, stepName)
+        if stepIndex is not None:
+            obj = obj[stepIndex]
+    if index is None:
+        setattr(obj, name, value)
+    else:
+        getattr(obj, name)[index] = value
+
+
+class Ref(NamedTuple):
+    # An object to look up, optionally followed by an attribute path to read off it
+    ClassName: str
+    Path: str
+    Attribute: str = ""
+
+
+class Struct(NamedTuple):
+    # A struct built from the Structs library, any Refs in its fields get resolved first
+    Factory: Callable[..., Any]
+    Fields: Dict[str, Any]
+
+
+class Clone(NamedTuple):
+    # A copy of the object at Template on the patched object, created inside it with the given properties
+    Name: str
+    Template: str
+    Properties: Dict[str, Any]
+
+
+class Description(NamedTuple):
+    # Text added to the end of a skill description, after cutting Trim characters off it
+    Suffix: str
+    Trim: int = 0
+
+
+class Patch(NamedTuple):
+    ClassName: str
+    ObjectClass: str
+    Path: str
+    Attribute: str
+    Operation: str
+    Value: Any
+
+
+SkillPatches: Tuple[Patch, ...] = (
+    # Zer0
+    Patch("Assassin", "SkillDefinition", "GD_Assassin_Skills.Cunning.Fearless",
+          "SkillEffectDefinitions", "Append", Struct(SkillEffectData, {
+              "AttributeToModify": Ref(
+                  "ResourcePoolAttributeDefinition",
+                  "D_Attributes.ShieldResourcePool.ShieldOnIdleRegenerationDelay"
+              ),
+              "EffectTarget": 1,
+              "ModifierType": 2,
+              "BaseModifierValue": AttributeInitializationData(
+                  BaseValueConstant=1.0,
+                  BaseValueAttribute=None,
+                  InitializationDefinition=None,
+                  BaseValueScaleConstant=1.0
+              ),
+              "GradeToStartApplyingEffect": 1,
+              "PerGradeUpgradeInterval": 1,
+              "PerGradeUpgrade": AttributeInitializationData(
+                  BaseValueConstant=1.0,
+                  BaseValueAttribute=None,
+                  InitializationDefinition=None,
+                  BaseValueScaleConstant=1.0
+              ),
+          })),
+    Patch("Assassin", "SkillDefinition", "GD_Assassin_Skills.Cunning.Fearless",
+          "SkillEffectPresentations", "Append",
+          Ref("SkillDefinition", "GD_Lilac_Skills_Mania.Skills.EmbraceThePain", "SkillEffectPresentations[1]")),
+    Patch("Assassin", "SkillDefinition", "GD_Assassin_Skills.Cunning.Fearless",
+          "SkillDescription", "Describe", Description(
+              " Additionally, increases the delay before your shields "
+              "[skill]start to recharge[-skill] after being depleted."
+          )),
+    Patch("Assassin", "Behavior_SpawnProjectile",
+          "GD_Assassin_Skills.ActionSkill.Skill_Stealth:BehaviorProviderDefinition_0.Behavior_SpawnProjectile_0",
+          "bInflictRadiusDamageOnOwner", "Set", False),
+
+    # Krieg
+    Patch("Psycho", "SkillDefinition", "GD_Lilac_Skills_Mania.Skills.SilenceTheVoices",
+          "SkillEffectPresentations[1]", "Set", Clone(
+              "AttributePresentationDefinition_2", "SkillEffectPresentations[1]",
+              {"bDisplayPercentAsFloat": True, "RoundingMode": 0}
+          )),
+    Patch("Psycho", "SkillDefinition", "GD_Lilac_Skills_Mania.Skills.SilenceTheVoices",
+          "SkillEffectDefinitions[0].PerGradeUpgrade.BaseValueConstant", "Set", -0.013333333),
+    Patch("Psycho", "SkillDefinition", "GD_Lilac_Skills_Mania.Skills.SilenceTheVoices",
+          "SkillEffectDefinitions[0].PerGradeUpgradeInterval", "Set", 1),
+    Patch("Psycho", "Behavior_Explode",
+          "GD_Lilac_SkillsBase.Buzzaxe.Projectile_Buzzaxe:BehaviorProviderDefinition_0.Behavior_Explode_6",
+          "InstigatorSelfDamageScale", "Scale", 1 / 3),
+    Patch("Psycho", "Behavior_Explode",
+          "GD_Lilac_SkillsBase.Buzzaxe.Projectile_Buzzaxe:BehaviorProviderDefinition_0.Behavior_Explode_6",
+          "Definition", "Set", Ref("ExplosionDefinition", "GD_Explosions.Slag.Explosion_SlagMaster")),
+    Patch("Psycho", "SkillDefinition", "GD_Lilac_Skills_Bloodlust.Skills.BuzzAxeBombadier",
+          "SkillDescription", "Describe", Description(" and [skill]slags[-skill] nearby enemies.", Trim=1)),
+)
+
+# Packages holding objects the patches borrow from other characters
+PatchPackages: Dict[str, Tuple[str, ...]] = {
+    "Assassin": ("GD_Lilac_Psycho_Streaming_SF",),
+}
+
+
+def GetPlayerClass(PC: UObject) -> str:
+    if PC is None or PC.PlayerClass is None:
+        return ""
+    return PC.PlayerClass.CharacterNameId.CharacterClassId.ClassName
+
+
+def GetPlayingClasses() -> Set[str]:
+    # A host also initializes skill trees for remote players, whose controllers are only found in the world
+    classes = {GetPlayerClass(player.Actor) for player in GetEngine().GamePlayers}
+    controller = GetEngine().GetCurrentWorldInfo().ControllerList
+    while controller is not None:
+        if controller.IsA("WillowPlayerController"):
+            classes.add(GetPlayerClass(controller))
+        controller = controller.NextController
+    return classes
+
+
+class ObjectSnapshot:
+    # The untouched values of every attribute patched on one object
+    __slots__ = ("Path", "Values")
+
+    def __init__(self, path: str) -> None:
+        self.Path: str = path
+        self.Values: Dict[str, Any] = {}
+
+
+class DescriptionPatcher:
+    """
+    Skill descriptions can only be changed through console commands, so each final description is worked out once
+    from the game's original text, and a command is only sent when a skill isn't already showing it.
+    """
+    def __init__(self) -> None:
+        self.Originals: Dict[str, str] = {}
+        self.Finals: Dict[str, str] = {}
+
+    def getFinal(self, path: str, skill: UObject, descriptions: List[Description]) -> str:
+        final = self.Finals.get(path)
+        if final is None:
+            final = self.Originals.setdefault(path, skill.SkillDescription)
+            for description in descriptions:
+                final = final[:len(final) - description.Trim] + description.Suffix
+            self.Finals[path] = final
+        return final
+
+    def Apply(self, PC: UObject, skills: List[Tuple[str, UObject, List[Description]]]) -> int:
+        changed = 0
+        for path, skill, descriptions in skills:
+            final = self.getFinal(path, skill, descriptions)
+            if skill.SkillDescription != final:
+                SetSkillDescription(PC, path, final)
+                changed += 1
+        return changed
+
+    def Restore(self, PC: UObject, skills: List[Tuple[str, UObject, List[Description]]]) -> int:
+        changed = 0
+        for path, skill, _ in skills:
+            original = self.Originals.get(path)
+            if original is not None and skill.SkillDescription != original:
+                SetSkillDescription(PC, path, original)
+                changed += 1
+        return changed
+
+
+class PatchEngine:
+    """
+    Applies a table of patches one player class at a time. All the objects a class' patches need are looked up in
+    one pass, and snapshotted, before anything is changed so the originals can be put back without reloading.
+    """
+    def __init__(self, patches: Tuple[Patch, ...], packages: Dict[str, Tuple[str, ...]]) -> None:
+        self.ClassPatches: Dict[str, List[Patch]] = {}
+        # Descriptions are rewritten as a whole by the DescriptionPatcher, rather than patched one entry at a time
+        self.ClassDescriptions: Dict[str, Dict[Tuple[str, str], List[Description]]] = {}
+        for patch in patches:
+            if patch.Operation == "Describe":
+                self.ClassDescriptions.setdefault(patch.ClassName, {}).setdefault(
+                    (patch.ObjectClass, patch.Path), []
+                ).append(patch.Value)
+            else:
+                self.ClassPatches.setdefault(patch.ClassName, []).append(patch)
+        self.Descriptions: DescriptionPatcher = DescriptionPatcher()
+        self.Packages = packages
+        self.LoadedPackages: Set[str] = set()
+        self.Objects: Dict[Tuple[str, str], UObject] = {}
+        self.Clones: Dict[Tuple[UObject, str], UObject] = {}
+        # Patches applied this session, along with the object they changed
+        self.Applied: Dict[Tuple[str, str], Tuple[Patch, UObject]] = {}
+        self.Snapshots: Dict[UObject, ObjectSnapshot] = {}
+        self.Timings: Dict[str, float] = {}
+
+    def collectRefs(self, value: Any, refs: List[Ref]) -> None:
+        if isinstance(value, Ref):
+            refs.append(value)
+        elif isinstance(value, (Struct, Clone)):
+            for field in (value.Fields if isinstance(value, Struct) else value.Properties).values():
+                self.collectRefs(field, refs)
+
+    def resolveAll(self, refs: List[Ref]) -> None:
+        for ref in refs:
+            key = (ref.ClassName, ref.Path)
+            if key in self.Objects:
+                continue
+            if ref.ClassName.endswith("AttributeDefinition"):
+                obj = FindAttribute(ref.ClassName, ref.Path)
+            else:
+                obj = FindObject(ref.ClassName, ref.Path)
+            if obj is not None:
+                KeepAlive(obj)
+                self.Objects[key] = obj
+
+    def resolveValue(self, value: Any, target: UObject) -> Any:
+        if isinstance(value, Ref):
+            obj = self.Objects[(value.ClassName, value.Path)]
+            return GetAttribute(obj, value.Attribute) if value.Attribute else obj
+        if isinstance(value, Struct):
+            return value.Factory(**{
+                name: self.resolveValue(field, target) for name, field in value.Fields.items()
+            })
+        if isinstance(value, Clone):
+            clone = self.Clones.get((target, value.Name))
+            if clone is None:
+                template = GetAttribute(target, value.Template)
+                clone = ConstructObject(Class=template.Class.Name, Outer=target, Name=value.Name, Template=template)
+                KeepAlive(clone)
+                clone.ObjectFlags.B |= 4
+                for name, field in value.Properties.items():
+                    setattr(clone, name, self.resolveValue(field, target))
+                self.Clones[(target, value.Name)] = clone
+            return clone
+        return value
+
+    def copyValue(self, patch: Patch, value: Any) -> Any:
+        if patch.Operation != "Append":
+            return value
+        # Arrays are copied element by element, structs have to be rebuilt as they point into the array itself
+        if isinstance(patch.Value, Struct):
+            return [patch.Value.Factory(element) for element in value]
+        return list(value)
+
+    def snapshot(self, patch: Patch, target: UObject) -> None:
+        snapshot = self.Snapshots.get(target)
+        if snapshot is None:
+            snapshot = self.Snapshots[target] = ObjectSnapshot(patch.Path)
+        # Only the first capture is kept, anything after that has already been patched
+        if patch.Attribute not in snapshot.Values:
+            snapshot.Values[patch.Attribute] = self.copyValue(patch, GetAttribute(target, patch.Attribute))
+
+    def applyPatch(self, patch: Patch, target: UObject) -> None:
+        current = GetAttribute(target, patch.Attribute)
+        if patch.Operation == "Append":
+            appended = self.resolveValue(patch.Value, target)
+            SetAttribute(target, patch.Attribute, self.copyValue(patch, current) + [appended])
+        elif patch.Operation == "Scale":
+            SetAttribute(target, patch.Attribute, current * patch.Value)
+        else:
+            SetAttribute(target, patch.Attribute, self.resolveValue(patch.Value, target))
+
+    @property
+    def AppliedClasses(self) -> Set[str]:
+        return {patch.ClassName for patch, _ in self.Applied.values()}
+
+    def loadPackages(self, className: str) -> None:
+        for package in self.Packages.get(className, ()):
+            if package not in self.LoadedPackages:
+                LoadPackage(package)
+                self.LoadedPackages.add(package)
+
+    def patchRefs(self, patches: List[Patch]) -> List[Ref]:
+        refs: List[Ref] = []
+        for patch in patches:
+            refs.append(Ref(patch.ObjectClass, patch.Path))
+            self.collectRefs(patch.Value, refs)
+        return refs
+
+    def describedSkills(self, className: Optional[str]) -> List[Tuple[str, UObject, List[Description]]]:
+        skills: List[Tuple[str, UObject, List[Description]]] = []
+        for describedClass, descriptions in self.ClassDescriptions.items():
+            if className is not None and describedClass != className:
+                continue
+            self.resolveAll([Ref(objectClass, path) for objectClass, path in descriptions])
+            for (objectClass, path), classDescriptions in descriptions.items():
+                skill = self.Objects.get((objectClass, path))
+                if skill is not None:
+                    skills.append((path, skill, classDescriptions))
+        return skills
+
+    def Preload(self) -> None:
+        # Does the loading and lookups ahead of time, so skill tree init only has to make the changes
+        startTime = perf_counter()
+        refs: List[Ref] = []
+        for className in self.ClassPatches.keys() | self.ClassDescriptions.keys():
+            self.loadPackages(className)
+            refs += self.patchRefs(self.ClassPatches.get(className, []))
+            refs += [Ref(objectClass, path) for objectClass, path in self.ClassDescriptions.get(className, ())]
+        self.resolveAll(refs)
+        # Objects from characters that aren't loaded yet are left for their skill tree init to find
+        wanted = {(ref.ClassName, ref.Path) for ref in refs}
+        self.Timings["Preload"] = (perf_counter() - startTime) * 1000
+        LogTiming(f"Preloaded {len(wanted & self.Objects.keys())}/{len(wanted)} objects, "
+                  f"moving {self.Timings['Preload']:.2f} ms off of skill tree init")
+
+    def Apply(self, className: str, PC: UObject) -> int:
+        # Descriptions are checked every init, it's only a string compare per skill unless one needs setting
+        describeStart = perf_counter()
+        skills = self.describedSkills(className)
+        described = self.Descriptions.Apply(PC, skills)
+        if described:
+            self.Timings[f"Describe {className}"] = (perf_counter() - describeStart) * 1000
+            LogTiming(f"Updated {described}/{len(skills)} skill descriptions in "
+                      f"{self.Timings[f'Describe {className}']:.2f} ms")
+
+        pending = [
+            patch for patch in self.ClassPatches.get(className, ())
+            if (patch.Path, patch.Attribute) not in self.Applied
+        ]
+        if not pending:
+            return 0
+
+        startTime = perf_counter()
+        self.loadPackages(className)
+        refs = self.patchRefs(pending)
+        self.resolveAll(refs)
+        self.Timings[f"Resolve {className}"] = (perf_counter() - startTime) * 1000
+        LogTiming(f"Resolved {len(refs)} objects for {className} in {self.Timings[f'Resolve {className}']:.2f} ms")
+
+        targets: List[Tuple[Patch, UObject]] = []
+        for patch in pending:
+            target = self.Objects.get((patch.ObjectClass, patch.Path))
+            if target is None:
+                Log(f"[Melee Enhancement] Couldn't find {patch.Path}, skipping its {patch.Attribute} patch")
+                continue
+            # Checked before anything is snapshotted, so a missing ref can't leave the class half patched
+            valueRefs: List[Ref] = []
+            self.collectRefs(patch.Value, valueRefs)
+            missing = [ref.Path for ref in valueRefs if (ref.ClassName, ref.Path) not in self.Objects]
+            if missing:
+                Log(f"[Melee Enhancement] Couldn't find {', '.join(missing)}, "
+                    f"skipping the {patch.Attribute} patch on {patch.Path}")
+                continue
+            self.snapshot(patch, target)
+            targets.append((patch, target))
+
+        applied = 0
+        for patch, target in targets:
+            patchStart = perf_counter()
+            self.applyPatch(patch, target)
+            self.Applied[(patch.Path, patch.Attribute)] = (patch, target)
+            label = f"{patch.Operation} {patch.Path}.{patch.Attribute}"
+            self.Timings[label] = (perf_counter() - patchStart) * 1000
+            LogTiming(f"  {label}: {self.Timings[label]:.3f} ms")
+            applied += 1
+        return applied
+
+    def Restore(self, className: Optional[str], PC: UObject) -> None:
+        # Restores every class when className is None
+        if PC is not None:
+            self.Descriptions.Restore(PC, self.describedSkills(className))
+
+        restoring: Dict[UObject, List[str]] = {}
+        for key, (patch, target) in list(self.Applied.items()):
+            if className is None or patch.ClassName == className:
+                restoring.setdefault(target, []).append(patch.Attribute)
+                del self.Applied[key]
+        if not restoring:
+            return
+
+        startTime = perf_counter()
+        for target, attributes in restoring.items():
+            objectStart = perf_counter()
+            snapshot = self.Snapshots[target]
+            # Put back newest first, in case two patches ever touch overlapping attributes
+            for attribute in reversed(attributes):
+                SetAttribute(target, attribute, snapshot.Values.pop(attribute))
+            if not snapshot.Values:
+                del self.Snapshots[target]
+            label = f"Restore {snapshot.Path}"
+            self.Timings[label] = (perf_counter() - objectStart) * 1000
+            LogTiming(f"  Restored {snapshot.Path}: {self.Timings[label]:.3f} ms")
+        label = f"Restore {className or 'all'}"
+        self.Timings[label] = (perf_counter() - startTime) * 1000
+        LogTiming(f"Restored {className or 'all'} patches in {self.Timings[label]:.2f} ms")
+
+
 class MeleeEnhancement(SDKMod):
     Name: str = "Melee Enhancement"
     Author: str = "LaryIsland"
@@ -30,7 +474,7 @@ class MeleeEnhancement(SDKMod):
         "<font color='#33fefe'>  Silence the Voices</font> scales self-hit chance\n"
         "<font color='#33fefe'>  Buzz Axe Bombadier</font> has slag explosions"
     )
-    Version: str = "1.0"
+    Version: str = "1.1"
 
     SupportedGames: Game = Game.BL2
     Types: ModTypes = ModTypes.Gameplay
@@ -45,95 +489,37 @@ class MeleeEnhancement(SDKMod):
         else:
             super().SettingsInputPressed(action)
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.Patches: PatchEngine = PatchEngine(SkillPatches, PatchPackages)
+
+    def Enable(self) -> None:
+        self.Patches.Preload()
+        super().Enable()
+
+    def Disable(self) -> None:
+        self.Patches.Restore(None, GetEngine().GamePlayers[0].Actor)
+        if AttributeSampler is not None:
+            AttributeSampler.Invalidate()
+        super().Disable()
+
     @Hook("WillowGame.PlayerSkillTree.Initialize")
+    @profile_hook("MeleeEnhancement.InjectSkillChanges")
     def InjectSkillChanges(self, caller: UObject, function: UFunction, params: FStruct) -> bool:
-        className = caller.Outer.PlayerClass.CharacterNameId.CharacterClassId.ClassName
-        if className == "Assassin":
-            LoadPackage("GD_Lilac_Psycho_Streaming_SF")
-            Fearless_SkillDefinition = FindObject("SkillDefinition", "GD_Assassin_Skills.Cunning.Fearless")
-
-            Fearless_SkillDefinition.SkillEffectDefinitions = [
-                SkillEffectData(SkillEffectDefinition) for SkillEffectDefinition
-                in Fearless_SkillDefinition.SkillEffectDefinitions] + \
-                [SkillEffectData(
-                    AttributeToModify=FindObject(
-                        "ResourcePoolAttributeDefinition",
-                        "D_Attributes.ShieldResourcePool.ShieldOnIdleRegenerationDelay"
-                    ),
-                    EffectTarget=1,
-                    ModifierType=2,
-                    BaseModifierValue=AttributeInitializationData(
-                        BaseValueConstant=1.0,
-                        BaseValueAttribute=None,
-                        InitializationDefinition=None,
-                        BaseValueScaleConstant=1.0
-                    ),
-                    GradeToStartApplyingEffect=1,
-                    PerGradeUpgradeInterval=1,
-                    PerGradeUpgrade=AttributeInitializationData(
-                        BaseValueConstant=1.0,
-                        BaseValueAttribute=None,
-                        InitializationDefinition=None,
-                        BaseValueScaleConstant=1.0
-                    ),
-                )]
-
-            SetSkillDescription(caller.Outer,
-                                "GD_Assassin_Skills.Cunning.Fearless", Fearless_SkillDefinition.SkillDescription
-                                + " Additionally, increases the delay before your shields "
-                                + "[skill]start to recharge[-skill] after being depleted.")
-
-            Fearless_SkillDefinition.SkillEffectPresentations = [
-                SkillEffectPresentation for SkillEffectPresentation
-                in Fearless_SkillDefinition.SkillEffectPresentations] \
-                + [FindObject(
-                    "SkillDefinition",
-                    "GD_Lilac_Skills_Mania.Skills.EmbraceThePain"
-                ).SkillEffectPresentations[1]
-            ]
-
-            FindObject(
-                "Behavior_SpawnProjectile",
-                "GD_Assassin_Skills.ActionSkill.Skill_Stealth:BehaviorProviderDefinition_0.Behavior_SpawnProjectile_0"
-            ).bInflictRadiusDamageOnOwner = False
-
-        elif className == "Psycho":
-            SilenceTheVoices_SkillDefinition = FindObject(
-                "SkillDefinition",
-                "GD_Lilac_Skills_Mania.Skills.SilenceTheVoices"
-            )
-
-            SelfHitPresentation = ConstructObject(Class="AttributePresentationDefinition",
-                                                  Outer=SilenceTheVoices_SkillDefinition,
-                                                  Name="AttributePresentationDefinition_2",
-                                                  Template=SilenceTheVoices_SkillDefinition.SkillEffectPresentations[1]
-                                                  )
-            KeepAlive(SelfHitPresentation)
-            SelfHitPresentation.ObjectFlags.B |= 4
-            SelfHitPresentation.bDisplayPercentAsFloat = True
-            SelfHitPresentation.RoundingMode = 0
-
-            SilenceTheVoices_SkillDefinition.SkillEffectPresentations[1] = SelfHitPresentation
-
-            SilenceTheVoices_SkillDefinition.SkillEffectDefinitions[0].PerGradeUpgrade.BaseValueConstant = -0.013333333
-            SilenceTheVoices_SkillDefinition.SkillEffectDefinitions[0].PerGradeUpgradeInterval = 1
-
-            BuzzaxeExplosion = FindObject(
-                "Behavior_Explode",
-                "GD_Lilac_SkillsBase.Buzzaxe.Projectile_Buzzaxe:BehaviorProviderDefinition_0.Behavior_Explode_6"
-            )
-
-            BuzzaxeExplosion.InstigatorSelfDamageScale /= 3
-            BuzzaxeExplosion.Definition = FindObject("ExplosionDefinition", "GD_Explosions.Slag.Explosion_SlagMaster")
-
-            SetSkillDescription(caller.Outer,
-                                "GD_Lilac_Skills_Bloodlust.Skills.BuzzAxeBombadier",
-                                FindObject(
-                                    "SkillDefinition",
-                                    "GD_Lilac_Skills_Bloodlust.Skills.BuzzAxeBombadier"
-                                ).SkillDescription[:-1] + " and [skill]slags[-skill] nearby enemies."
-                                )
+        className = GetPlayerClass(caller.Outer)
+        changed = False
+
+        # After a class switch, the old class' changes are put back unless another player is still using them
+        otherClasses = self.Patches.AppliedClasses - {className}
+        if otherClasses:
+            for otherClass in otherClasses - GetPlayingClasses():
+                self.Patches.Restore(otherClass, caller.Outer)
+                changed = True
 
+        if self.Patches.Apply(className, caller.Outer):
+            changed = True
+        if changed and AttributeSampler is not None:
+            AttributeSampler.Invalidate()
         return True
 
 
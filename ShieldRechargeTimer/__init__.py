@@ -1,70 +1,322 @@
+import csv
+import os
+import threading
 import webbrowser
+from collections import deque
+from math import ceil
+from sys import intern
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from unrealsdk import (FindObject, FStruct, GetEngine, Log,  # type: ignore
                        RemoveHook, RunHook, UFunction, UObject)
 
 from ..ModMenu import (EnabledSaveType, Game, Mods, ModTypes, Options,
-                       RegisterMod, SDKMod)
+                       RegisterMod, SaveModSettings, SDKMod)
+
+try:
+    from ..HookProfiler import profile_hook
+except ImportError:
+    def profile_hook(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return lambda func: func
+
+
+# key -> (x, y, size) change per step
+MoveKeyDeltas: Dict[str, Tuple[int, int, int]] = {
+    "Up": (0, -1, 0),
+    "Down": (0, 1, 0),
+    "Left": (-1, 0, 0),
+    "Right": (1, 0, 0),
+    "MouseScrollUp": (0, 0, 1),
+    "MouseScrollDown": (0, 0, -1),
+}
 
 
 # used for moving the timer while the hud is up
+@profile_hook("ShieldRechargeTimer.RechargeTimerMoveKeys")
 def RechargeTimerMoveKeys(caller: UObject, function: UFunction, params: FStruct):
-    if instance.EnableMovement.CurrentValue and params.Event == 0:
-        if params.Key == "Up":
-            instance.yPosSlider.CurrentValue -= 1
-        if params.Key == "Down":
-            instance.yPosSlider.CurrentValue += 1
-        if params.Key == "Left":
-            instance.xPosSlider.CurrentValue -= 1
-        if params.Key == "Right":
-            instance.xPosSlider.CurrentValue += 1
-        if params.Key == "MouseScrollUp":
-            instance.SizeSlider.CurrentValue += 1
-        if params.Key == "MouseScrollDown":
-            instance.SizeSlider.CurrentValue -= 1
+    if instance.EnableMovement.CurrentValue:
+        delta = MoveKeyDeltas.get(params.Key)
+        if delta is not None:
+            instance.dragTimer(params.Key, delta, params.Event)
     return True
 
 
+@profile_hook("ShieldRechargeTimer.RechargeTimerPlayerDamaged")
 def RechargeTimerPlayerDamaged(caller: UObject, function: UFunction, params: FStruct) -> bool:
+    # Damage events for every pawn come through here, so anyone that isn't a local player gets dropped first
+    timer = instance.PlayerTimers.get(caller.Controller)
+    if timer is None:
+        return True
+
+    currentTime = caller.WorldInfo.TimeSeconds
+    # Every hit restarts the shield's recharge delay, so the history is kept before any of the display filters
+    if instance.RecordHistory.CurrentValue:
+        instance.recordDamage(timer, caller, currentTime, params.Damage)
+
     if instance.OnlyWithRoidShield.CurrentValue:
-        if instance.ShieldRoidValue.GetValue(caller.Controller)[0] == 0.:
+        # Only changes when the shield does, so it's worked out on the first hit after an equip
+        if timer.RoidShield is None:
+            timer.RoidShield = Sampler.GetValue(instance.ShieldRoidValue, caller.Controller) != 0.
+        else:
+            instance.RoidChecksAvoided += 1
+        if not timer.RoidShield:
             return True
 
-    instance.LastDamageTakenTime = caller.WorldInfo.TimeSeconds
-    if (not instance.OnlyWhenDepleted.CurrentValue) or (params.Damage >= instance.ShieldCurValue.GetValue(caller)[0]) \
-            and (instance.TimeRemaining <= 0):
-        instance.TimeRemaining = 1
-        RunHook("WillowGame.WillowGameViewportClient.PostRender", "PostRenderRechargeTimer", onPostRenderRechargeTimer)
-        RunHook("WillowGame.WillowPlayerController.PlayerTick", "RechargeTimerPlayerTicks", RechargeTimerPlayerTicks)
+    timerRunning = timer.LastDamageTakenTime <= currentTime < timer.RechargeDeadline
+    timer.LastDamageTakenTime = currentTime
+    shieldValue = 0.
+    if not timerRunning and instance.OnlyWhenDepleted.CurrentValue:
+        shieldValue = Sampler.GetValue(instance.ShieldCurValue, caller)
+    if timerRunning or (not instance.OnlyWhenDepleted.CurrentValue) or (params.Damage >= shieldValue):
+        # The delay only needs reading once per hit, the remaining time is worked out from this when drawing
+        rechargeDelay = Sampler.GetValue(instance.ShieldRegenDelay, caller.Controller)
+        timer.RechargeDeadline = currentTime + rechargeDelay
+        instance.extendTimerTexts(ceil(rechargeDelay * instance.TicksPerSecond))
+        if not timerRunning:
+            timer.TimerVisible = None
+        timer.TimerActive = True
+        instance.TimerActive = True
+
+    # The pawn's shield is about to drop, so another hit this frame needs to read it fresh
+    Sampler.Invalidate(caller)
     return True
 
 
-def GetTimeUntilShieldRecharge(PC) -> float:
-    try:
-        # resets timer if you quit whilst your shield is recharging and switch character
-        elapsedTime = PC.MyWillowPawn.WorldInfo.TimeSeconds - instance.LastDamageTakenTime
-        if elapsedTime < 0:
-            return 0.
-    except AttributeError:
-        return 0.
+# Menus, vehicles and going down are rare compared to frames, so these just flag the visibility for a recheck
+@profile_hook("ShieldRechargeTimer.RechargeTimerVisibilityChanged")
+def RechargeTimerVisibilityChanged(caller: UObject, function: UFunction, params: FStruct) -> bool:
+    for timer in instance.PlayerTimers.values():
+        timer.TimerVisible = None
+    return True
 
-    return round(instance.ShieldRegenDelay.GetValue(PC)[0] - elapsedTime, 1)
+
+@profile_hook("ShieldRechargeTimer.RechargeTimerEquipmentChanged")
+def RechargeTimerEquipmentChanged(caller: UObject, function: UFunction, params: FStruct) -> bool:
+    Sampler.Invalidate()
+    for timer in instance.PlayerTimers.values():
+        timer.RoidShield = None
+    return True
+
+
+@profile_hook("ShieldRechargeTimer.RechargeTimerAttributesChanged")
+def RechargeTimerAttributesChanged(caller: UObject, function: UFunction, params: FStruct) -> bool:
+    Sampler.Invalidate()
+    return True
 
 
-def RechargeTimerPlayerTicks(caller: UObject, function: UFunction, params: FStruct) -> bool:
-    rechargeTime = GetTimeUntilShieldRecharge(caller)
-    instance.TimeRemaining = rechargeTime
-    if rechargeTime <= 0:
-        RemoveHook("WillowGame.WillowPlayerController.PlayerTick", "RechargeTimerPlayerTicks")
-        RemoveHook("WillowGame.WillowGameViewportClient.PostRender", "PostRenderRechargeTimer")
+@profile_hook("ShieldRechargeTimer.RechargeTimerPlayersChanged")
+def RechargeTimerPlayersChanged(caller: UObject, function: UFunction, params: FStruct) -> bool:
+    instance.LocalPlayersChanged = True
     return True
 
 
+# Controllers get swapped out while loading, so nothing is drawn from the old ones until the players are refreshed
+@profile_hook("ShieldRechargeTimer.RechargeTimerLoadingStarted")
+def RechargeTimerLoadingStarted(caller: UObject, function: UFunction, params: FStruct) -> bool:
+    for timer in instance.PlayerTimers.values():
+        timer.Reset()
+    instance.TimerActive = False
+    instance.LocalPlayersChanged = True
+    return True
+
+
+@profile_hook("ShieldRechargeTimer.onPostRenderRechargeTimer")
 def onPostRenderRechargeTimer(caller: UObject, function: UFunction, params: FStruct) -> bool:
-    instance.displayFeedback(params)
+    Sampler.NextFrame()
+    if instance.LocalPlayersChanged:
+        instance.refreshLocalPlayers()
+    if instance.DragCommitTime and perf_counter() >= instance.DragCommitTime:
+        instance.commitDrag()
+    # Registered for as long as the mod is enabled, rather than re-registered every time the shield breaks
+    if not instance.TimerActive:
+        return True
+
+    gamePlayers = GetEngine().GamePlayers
+    timerActive = False
+    for timer in instance.PlayerTimers.values():
+        if timer.TimerActive or timer.CycleStart is not None:
+            # Quitting to the menu can destroy a controller without a loading movie, so check it's still in use
+            player = gamePlayers[timer.PlayerIndex] if timer.PlayerIndex < len(gamePlayers) else None
+            if player is None or player.Actor is not timer.PC:
+                timer.Reset()
+                instance.LocalPlayersChanged = True
+                continue
+            if timer.CycleStart is not None:
+                currentTime = timer.PC.WorldInfo.TimeSeconds
+                if not timer.CycleStart[0] <= currentTime < timer.CycleDeadline:
+                    instance.finishCycle(timer, currentTime)
+            if timer.TimerActive:
+                instance.displayFeedback(params, timer)
+            timerActive |= timer.TimerActive or timer.CycleStart is not None
+    instance.TimerActive = timerActive
     return True
 
 
+class AttributeSampler:
+    """
+    Resolves attribute definitions once and caches their values per context object for the rest of the frame,
+    so repeat reads of the same attribute don't go back to the engine. Melee Enhancement shares this instance
+    to look up ShieldOnIdleRegenerationDelay and to drop cached values after changing what modifies it.
+    """
+    def __init__(self) -> None:
+        self.Definitions: Dict[Tuple[str, str], UObject] = {}
+        self.Values: Dict[UObject, Dict[UObject, float]] = {}
+
+    def Resolve(self, className: str, path: str) -> UObject:
+        definition = self.Definitions.get((className, path))
+        if definition is None:
+            definition = FindObject(className, path)
+            if definition is not None:
+                self.Definitions[(className, path)] = definition
+        return definition
+
+    def GetValue(self, attribute: UObject, context: UObject) -> float:
+        contextValues = self.Values.get(context)
+        if contextValues is None:
+            contextValues = self.Values[context] = {}
+        value = contextValues.get(attribute)
+        if value is None:
+            value = contextValues[attribute] = attribute.GetValue(context)[0]
+        return value
+
+    def Invalidate(self, context: Optional[UObject] = None) -> None:
+        if context is None:
+            self.Values.clear()
+        else:
+            self.Values.pop(context, None)
+
+    def NextFrame(self) -> None:
+        if self.Values:
+            self.Values.clear()
+
+
+Sampler = AttributeSampler()
+
+
+class RechargeHistory:
+    """
+    Keeps finished damage -> recharge cycles in memory and hands them to a background thread in batches, so
+    recording never puts file writes on the game thread.
+    """
+    Columns: Tuple[str, ...] = (
+        "Player", "DamageTime", "RechargeTime", "Delay", "Damage", "ShieldBeforeHit", "Depleted"
+    )
+
+    def __init__(self, path: str, size: int = 4096, batchSize: int = 256) -> None:
+        self.Path: str = path
+        self.BatchSize: int = batchSize
+        self.Cycles: Deque[Tuple[Any, ...]] = deque(maxlen=size)
+        self.WriteLock = threading.Lock()
+
+    def Record(self, player: int, cycleStart: Tuple[float, float, float, float], rechargeTime: float) -> None:
+        damageTime, delay, damage, shieldValue = cycleStart
+        self.Cycles.append((player, damageTime, rechargeTime, delay, damage, shieldValue, int(damage >= shieldValue)))
+        if len(self.Cycles) >= self.BatchSize:
+            self.Flush()
+
+    def Flush(self) -> None:
+        if len(self.Cycles) == 0:
+            return
+        cycles: List[Tuple[Any, ...]] = list(self.Cycles)
+        self.Cycles.clear()
+        threading.Thread(target=self.Write, args=(cycles,), daemon=True).start()
+
+    def Write(self, cycles: List[Tuple[Any, ...]]) -> None:
+        with self.WriteLock:
+            writeHeader: bool = not os.path.exists(self.Path)
+            with open(self.Path, "a", newline="") as file:
+                writer = csv.writer(file)
+                if writeHeader:
+                    writer.writerow(self.Columns)
+                writer.writerows(cycles)
+
+
+class PlayerTimer:
+    __slots__ = (
+        "PC",
+        "PlayerIndex",
+        "CycleStart",
+        "CycleDeadline",
+        "RoidShield",
+        "ViewportOrigin",
+        "ViewportSize",
+        "TimerActive",
+        "LastDamageTakenTime",
+        "RechargeDeadline",
+        "TimeRemaining",
+        "TimerTicks",
+        "TimerText",
+        "TimerVisible",
+        "ThirdPersonMenu",
+    )
+
+    def __init__(self, PC: UObject, playerIndex: int) -> None:
+        self.PC: UObject = PC
+        self.PlayerIndex: int = playerIndex
+        self.RoidShield: Optional[bool] = None
+        self.ViewportOrigin: Tuple[float, float] = (0., 0.)
+        self.ViewportSize: Tuple[float, float] = (1., 1.)
+        self.LastDamageTakenTime: float = 0.
+        self.TimerVisible: Optional[bool] = None
+        self.ThirdPersonMenu: bool = False
+        self.Reset()
+
+    def Stop(self) -> None:
+        self.TimerActive: bool = False
+        self.RechargeDeadline: float = 0.
+        self.TimeRemaining: float = 0.
+        self.TimerTicks: int = 0
+        self.TimerText: str = ""
+
+    def Reset(self) -> None:
+        self.Stop()
+        self.CycleStart: Optional[Tuple[float, float, float, float]] = None
+        self.CycleDeadline: float = 0.
+
+
+TimerHooks = (
+    ("WillowGame.WillowPlayerPawn.TakeDamage", "RechargeTimerPlayerDamaged", RechargeTimerPlayerDamaged),
+    ("WillowGame.WillowUIInteraction.InputKey", "RechargeTimerMoveKeys", RechargeTimerMoveKeys),
+    ("WillowGame.WillowGameViewportClient.PostRender", "PostRenderRechargeTimer", onPostRenderRechargeTimer),
+    ("Engine.PlayerController.ReceivedPlayer", "RechargeTimerPlayersChanged", RechargeTimerPlayersChanged),
+    (
+        "WillowGame.WillowPlayerController.WillowClientShowLoadingMovie",
+        "RechargeTimerLoadingStarted",
+        RechargeTimerLoadingStarted
+    ),
+    (
+        "WillowGame.WillowPlayerController.WillowClientDisableLoadingMovie",
+        "RechargeTimerPlayersChanged",
+        RechargeTimerPlayersChanged
+    ),
+    *(
+        (target, "RechargeTimerEquipmentChanged", RechargeTimerEquipmentChanged) for target in (
+            "WillowGame.WillowInventoryManager.ReadyBackpackInventory",
+            "WillowGame.WillowInventoryManager.InventoryUnreadied",
+        )
+    ),
+    *(
+        (target, "RechargeTimerAttributesChanged", RechargeTimerAttributesChanged) for target in (
+            "WillowGame.PlayerSkillTree.Initialize",
+            "WillowGame.WillowPlayerController.ServerUpgradeSkill",
+        )
+    ),
+    *(
+        (target, "RechargeTimerVisibilityChanged", RechargeTimerVisibilityChanged) for target in (
+            "WillowGame.PauseGFxMovie.Start",
+            "WillowGame.PauseGFxMovie.OnClose",
+            "WillowGame.StatusMenuExGFxMovie.Start",
+            "WillowGame.StatusMenuExGFxMovie.OnClose",
+            "WillowGame.WillowVehicle.DriverEnter",
+            "WillowGame.WillowVehicle.DriverLeave",
+            "WillowGame.WillowPlayerPawn.GoFromHealthyToInjured",
+            "WillowGame.WillowPlayerPawn.GoFromInjuredToHealthy",
+        )
+    ),
+)
+
+
 class ShieldRechargeTimer(SDKMod):
     Name: str = "Shield Recharge Timer"
     Author: str = "LaryIsland"
@@ -72,7 +324,7 @@ class ShieldRechargeTimer(SDKMod):
         "<font size='26' color='#de5b00'>     Shield Recharge Timer</font>\n\n"
         "Displays a configurable timer on your HUD that counts the seconds before your shield starts to recharge.\n\n"
     )
-    Version: str = "1.0"
+    Version: str = "1.1"
 
     SupportedGames: Game = Game.BL2 | Game.TPS
     Types: ModTypes = ModTypes.Utility
@@ -87,11 +339,26 @@ class ShieldRechargeTimer(SDKMod):
         else:
             super().SettingsInputPressed(action)
 
-    TimeRemaining: float = 0.
-    LastDamageTakenTime: float = 0.
+    TimerActive: bool = False
+    HookOperations: int = 0
+    RoidChecksAvoided: int = 0
+    LocalPlayersChanged: bool = True
+    DragKey: str = ""
+    DragStreak: int = 0
+    LastDragTime: float = 0.
+    DragCommitTime: float = 0.
 
     def __init__(self) -> None:
         self.Options = []
+        self.PlayerTimers: Dict[UObject, PlayerTimer] = {}
+        self.Fonts = [
+            "UI_Fonts.Font_Willowbody_18pt",
+            "UI_Fonts.Font_Willowhead_8pt",
+            "UI_Fonts.Font_Hud_Medium",
+            "EngineFonts.SmallFont",
+            "EngineFonts.TinyFont"
+        ]
+        self.Font = None
         self.RedSlider = Options.Slider(
             Caption="Red",
             Description="Red value for the text colour.",
@@ -177,6 +444,12 @@ class ShieldRechargeTimer(SDKMod):
                      "Engine 1",
                      "Engine 2"]
         )
+        self.TimerPrecision = Options.Spinner(
+            Caption="Timer Precision",
+            Description="Whether the timer counts down in tenths of a second or in whole seconds.",
+            StartingValue="Tenths",
+            Choices=["Tenths", "Seconds"]
+        )
         self.ShowInMenu = Options.Boolean(
             Caption="Show in Pause Menu",
             Description="When enabled, the timer will still show in the pause menu.",
@@ -197,23 +470,157 @@ class ShieldRechargeTimer(SDKMod):
             Description="When enabled, the timer will only show when you have a roid shield equipped.",
             StartingValue=False,
         )
+        self.RecordHistory = Options.Boolean(
+            Caption="Record Recharge History",
+            Description=(
+                "When enabled, every time your shield starts recharging the delay, damage taken and shield "
+                "before the hit are saved to recharge_history.csv in the mod folder."
+            ),
+            StartingValue=False,
+        )
         self.Options = [
             self.TextColour,
             self.TimerPos,
             self.SizeSlider,
             self.FontChoice,
+            self.TimerPrecision,
             self.EnableMovement,
             self.ShowInMenu,
             self.OnlyWhenDepleted,
-            self.OnlyWithRoidShield
+            self.OnlyWithRoidShield,
+            self.RecordHistory
         ]
+        self.History = RechargeHistory(os.path.join(os.path.dirname(__file__), "recharge_history.csv"))
+        self.updateDrawColour()
+        self.setTimerPrecision(self.TimerPrecision.CurrentValue)
+        # Ordered to match the (x, y, size) movement key deltas
+        self.LayoutSliders = (self.xPosSlider, self.yPosSlider, self.SizeSlider)
+        self.DragOffset: List[int] = [0, 0, 0]
+        self.updateLayout()
+
+    # The font and colour only change from the options menu, so they're resolved there rather than every frame
+    def ModOptionChanged(self, option, new_value) -> None:
+        if option is self.ShowInMenu:
+            for timer in self.PlayerTimers.values():
+                timer.TimerVisible = None
+        elif option is self.TimerPrecision:
+            self.setTimerPrecision(new_value)
+        elif option is self.RecordHistory and not new_value:
+            for timer in self.PlayerTimers.values():
+                timer.CycleStart = None
+            self.History.Flush()
+        elif option is self.FontChoice:
+            self.updateFont(new_value)
+        elif option in self.TextColour.Children:
+            self.updateDrawColour(option, new_value)
+        elif option in self.LayoutSliders:
+            self.updateLayout(option, new_value)
+
+    def updateFont(self, fontChoice: str) -> None:
+        self.Font = FindObject("Font", self.Fonts[self.FontChoice.Choices.index(fontChoice)])
+
+    def updateDrawColour(self, changedSlider=None, newValue: int = 0) -> None:
+        self.DrawColour = tuple(
+            newValue if slider is changedSlider else slider.CurrentValue
+            for slider in (self.BlueSlider, self.GreenSlider, self.RedSlider, self.AlphaSlider)
+        )
 
-    def DisplayText(self, canvas, text, x, y, color, scalex, scaley) -> None:
-        fontindex = self.FontChoice.Choices.index(self.FontChoice.CurrentValue)
-        canvas.Font = FindObject("Font", self.Fonts[fontindex])
+    def updateLayout(self, changedSlider=None, newValue: int = 0) -> None:
+        self.LayoutValues: List[int] = []
+        for slider, offset in zip(self.LayoutSliders, self.DragOffset):
+            value = (newValue if slider is changedSlider else slider.CurrentValue) + offset
+            self.LayoutValues.append(max(slider.MinValue, min(slider.MaxValue, value)))
+        self.TimerLayout: Tuple[float, float, float] = (
+            self.LayoutValues[0] / 1000,
+            self.LayoutValues[1] / 1000,
+            self.LayoutValues[2] / 100
+        )
 
-        trueX = canvas.SizeX * x
-        trueY = canvas.SizeX * y
+    def dragTimer(self, key: str, delta: Tuple[int, int, int], event: int) -> None:
+        """
+        Moving the timer only previews the new position, the sliders themselves are updated once the key is
+        released, or for the scroll wheel once it's been still for half a second.
+        """
+        currentTime = perf_counter()
+        if event == 1:
+            if delta[2] == 0:
+                self.commitDrag()
+            return
+        if event not in (0, 2):
+            return
+
+        # Holding a key or spinning the wheel speeds the timer up, so it doesn't take hundreds of steps to cross
+        if key == self.DragKey and currentTime - self.LastDragTime < 0.25:
+            self.DragStreak += 1
+        else:
+            self.DragStreak = 0
+        self.DragKey = key
+        self.LastDragTime = currentTime
+
+        step = min(1 + self.DragStreak // 5, 20)
+        self.DragOffset = [offset + change * step for offset, change in zip(self.DragOffset, delta)]
+        self.DragCommitTime = currentTime + 0.5
+        self.updateLayout()
+
+    def commitDrag(self) -> None:
+        self.DragCommitTime = 0.
+        if not any(self.DragOffset):
+            return
+        for slider, value in zip(self.LayoutSliders, self.LayoutValues):
+            slider.CurrentValue = value
+        self.DragOffset = [0, 0, 0]
+        self.updateLayout()
+        SaveModSettings(self)
+
+    def setTimerPrecision(self, timerPrecision: str) -> None:
+        self.TicksPerSecond: int = 1 if timerPrecision == "Seconds" else 10
+        self.TimerTexts: List[str] = []
+        for timer in self.PlayerTimers.values():
+            timer.TimerTicks = -1
+
+    # Timer text only ever shows one of a few hundred values, so they're formatted once and reused every frame
+    def extendTimerTexts(self, ticks: int) -> None:
+        for tick in range(len(self.TimerTexts), ticks + 1):
+            self.TimerTexts.append(intern(str(tick) if self.TicksPerSecond == 1 else f"{tick / 10:.1f}"))
+
+    def recordDamage(self, timer: PlayerTimer, pawn: UObject, currentTime: float, damage: float) -> None:
+        if timer.CycleStart is not None and not timer.CycleStart[0] <= currentTime < timer.CycleDeadline:
+            self.finishCycle(timer, currentTime)
+        rechargeDelay = Sampler.GetValue(self.ShieldRegenDelay, pawn.Controller)
+        if timer.CycleStart is None:
+            timer.CycleStart = (currentTime, rechargeDelay, damage, Sampler.GetValue(self.ShieldCurValue, pawn))
+        timer.CycleDeadline = currentTime + rechargeDelay
+        self.TimerActive = True
+
+    def finishCycle(self, timer: PlayerTimer, currentTime: float) -> None:
+        # The clock going backwards means the player left the world partway through, so the cycle never finished
+        if currentTime >= timer.CycleStart[0]:
+            self.History.Record(timer.PlayerIndex, timer.CycleStart, timer.CycleDeadline)
+        timer.CycleStart = None
+
+    def refreshLocalPlayers(self) -> None:
+        playerTimers: Dict[UObject, PlayerTimer] = {}
+        for playerIndex, player in enumerate(GetEngine().GamePlayers):
+            if player is None or player.Actor is None:
+                continue
+            timer = self.PlayerTimers.get(player.Actor) or PlayerTimer(player.Actor, playerIndex)
+            # Players further up the list can drop out, moving everyone after them down a slot
+            timer.PlayerIndex = playerIndex
+            timer.ViewportOrigin = (player.Origin.X, player.Origin.Y)
+            timer.ViewportSize = (player.Size.X, player.Size.Y)
+            timer.TimerVisible = None
+            playerTimers[player.Actor] = timer
+        self.PlayerTimers = playerTimers
+        self.LocalPlayersChanged = False
+
+    def DisplayText(self, canvas, timer, text, x, y, color, scalex, scaley) -> None:
+        if self.Font is None:
+            self.updateFont(self.FontChoice.CurrentValue)
+        canvas.Font = self.Font
+
+        # Positions are relative to the player's own split-screen viewport
+        trueX = canvas.SizeX * (timer.ViewportOrigin[0] + timer.ViewportSize[0] * x)
+        trueY = canvas.SizeY * timer.ViewportOrigin[1] + canvas.SizeX * timer.ViewportSize[1] * y
 
         canvas.SetPos(trueX, trueY, 0)
 
@@ -222,63 +629,91 @@ class ShieldRechargeTimer(SDKMod):
         except Exception:
             pass
 
-        canvas.DrawText(str(text), True, scalex, scaley)
+        canvas.DrawText(text, True, scalex, scaley)
 
-    def displayFeedback(self, params):
-        PC = GetEngine().GamePlayers[0].Actor
-        if not params.Canvas:
+    def displayFeedback(self, params, timer):
+        PC = timer.PC
+        currentTime = PC.WorldInfo.TimeSeconds
+        timerTicks = ceil((timer.RechargeDeadline - currentTime) * self.TicksPerSecond)
+        # resets timer if you quit whilst your shield is recharging and switch character
+        if timerTicks <= 0 or currentTime < timer.LastDamageTakenTime:
+            timer.Stop()
             return True
+        if timerTicks != timer.TimerTicks:
+            timer.TimerTicks = timerTicks
+            timer.TimeRemaining = timerTicks / self.TicksPerSecond
+            if timerTicks >= len(self.TimerTexts):
+                self.extendTimerTexts(timerTicks)
+            timer.TimerText = self.TimerTexts[timerTicks]
 
-        if PC.GetHUDMovie() is None or PC.bViewingThirdPersonMenu:
-            if not PC.GFxUIManager.IsMoviePlaying(PC.PauseMenuDefinition) or not self.ShowInMenu.CurrentValue:
-                return True
+        if not params.Canvas:
+            return True
 
-        if PC.MyWillowPawn.IsInjured() or PC.MyWillowPawn.DrivenVehicle is not None:
+        # Vendors, mission boards, fast travel and the like all open as third person menus, rather than hooking
+        # each of them the flag they share is compared every frame, it's a single property read
+        thirdPersonMenu = PC.bViewingThirdPersonMenu
+        if timer.TimerVisible is None or thirdPersonMenu != timer.ThirdPersonMenu:
+            timer.TimerVisible = self.isTimerVisible(PC)
+            timer.ThirdPersonMenu = thirdPersonMenu
+        if not timer.TimerVisible:
             return True
 
         canvas = params.Canvas
         self.DisplayText(
             canvas,
-            self.TimeRemaining,
-            self.xPosSlider.CurrentValue / 1000,
-            self.yPosSlider.CurrentValue / 1000,
-            (
-                self.BlueSlider.CurrentValue,
-                self.GreenSlider.CurrentValue,
-                self.RedSlider.CurrentValue,
-                self.AlphaSlider.CurrentValue
-            ),
-            self.SizeSlider.CurrentValue / 100,
-            self.SizeSlider.CurrentValue / 100
+            timer,
+            timer.TimerText,
+            self.TimerLayout[0],
+            self.TimerLayout[1],
+            self.DrawColour,
+            self.TimerLayout[2],
+            self.TimerLayout[2]
         )
         return True
 
+    def isTimerVisible(self, PC) -> bool:
+        if PC.GetHUDMovie() is None or PC.bViewingThirdPersonMenu:
+            if not PC.GFxUIManager.IsMoviePlaying(PC.PauseMenuDefinition) or not self.ShowInMenu.CurrentValue:
+                return False
+
+        if PC.MyWillowPawn.IsInjured() or PC.MyWillowPawn.DrivenVehicle is not None:
+            return False
+
+        return True
+
     def Enable(self):
-        RunHook("WillowGame.WillowPlayerPawn.TakeDamage", "RechargeTimerPlayerDamaged", RechargeTimerPlayerDamaged)
-        RunHook("WillowGame.WillowUIInteraction.InputKey", "RechargeTimerMoveKeys", RechargeTimerMoveKeys)
-        self.ShieldRegenDelay = FindObject(
+        self.TimerActive = False
+        self.LocalPlayersChanged = True
+        self.PlayerTimers = {}
+        for target, name, hook in TimerHooks:
+            RunHook(target, name, hook)
+            self.HookOperations += 1
+        Sampler.Invalidate()
+        self.ShieldRegenDelay = Sampler.Resolve(
             "ResourcePoolAttributeDefinition",
             "D_Attributes.ShieldResourcePool.ShieldOnIdleRegenerationDelay"
         )
-        self.ShieldCurValue = FindObject(
+        self.ShieldCurValue = Sampler.Resolve(
             "ResourcePoolAttributeDefinition",
             "D_Attributes.ShieldResourcePool.ShieldCurrentValue"
         )
-        self.ShieldRoidValue = FindObject(
+        self.ShieldRoidValue = Sampler.Resolve(
             "AttributeDefinition",
             "D_Attributes.Shield.RoidMeleeDamage"
         )
-        self.Fonts = [
-            "UI_Fonts.Font_Willowbody_18pt",
-            "UI_Fonts.Font_Willowhead_8pt",
-            "UI_Fonts.Font_Hud_Medium",
-            "EngineFonts.SmallFont",
-            "EngineFonts.TinyFont"
-        ]
+        self.updateFont(self.FontChoice.CurrentValue)
+        self.updateDrawColour()
+        self.setTimerPrecision(self.TimerPrecision.CurrentValue)
+        self.updateLayout()
 
     def Disable(self):
-        RemoveHook("WillowGame.WillowGameViewportClient.PostRender", "PostRenderRechargeTimer")
-        RemoveHook("WillowGame.WillowPlayerPawn.TakeDamage", "RechargeTimerPlayerDamaged")
+        self.commitDrag()
+        for target, name, _ in TimerHooks:
+            RemoveHook(target, name)
+            self.HookOperations += 1
+        self.TimerActive = False
+        self.PlayerTimers = {}
+        self.History.Flush()
 
 
 instance = ShieldRechargeTimer()
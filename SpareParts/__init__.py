@@ -1,6 +1,7 @@
 import re
 import webbrowser
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
 
 from unrealsdk import (FindObject, FStruct, GetEngine, Log,  # type: ignore
                        UFunction, UObject)
@@ -15,6 +16,86 @@ except ModuleNotFoundError:
     webbrowser.open("https://bl-sdk.github.io/requirements/?mod=Spare%20Parts&UserFeedback&Python%20Part%20Notifier")
     raise
 
+try:
+    from ..HookProfiler import profile_hook
+except ImportError:
+    def profile_hook(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return lambda func: func
+
+
+FontTagPattern = re.compile(r"<(\/){0,1}font( color=(\"|\')#[0-z]{6}(\"|\')){0,1}>")
+PartPrefixPattern = re.compile(".* ")
+
+PartsList: List[List[Tuple[str, str, str]]] = [[  # Weapon Parts
+    ("Accessory1PartData", "Accessory1PartDefinition", ""),
+    ("Accessory2PartData", "Accessory2PartDefinition", ""),
+    ("BarrelPartData", "BarrelPartDefinition", ""),
+    ("BodyPartData", "BodyPartDefinition", ""),
+    ("ElementalPartData", "ElementalPartDefinition", ""),
+    ("GripPartData", "GripPartDefinition", ""),
+    ("SightPartData", "SightPartDefinition", ""),
+    ("StockPartData", "StockPartDefinition", ""),
+    ("MaterialPartData", "MaterialPartDefinition", "")
+], [  # Item Parts
+    ("AlphaParts", "AlphaPartData", "AlphaItemPartDefinition"),
+    ("BetaParts", "BetaPartData", "BetaItemPartDefinition"),
+    ("GammaParts", "GammaPartData", "GammaItemPartDefinition"),
+    ("DeltaParts", "DeltaPartData", "DeltaItemPartDefinition"),
+    ("EpsilonParts", "EpsilonPartData", "EpsilonItemPartDefinition"),
+    ("ZetaParts", "ZetaPartData", "ZetaItemPartDefinition"),
+    ("EtaParts", "EtaPartData", "EtaItemPartDefinition"),
+    ("ThetaParts", "ThetaPartData", "ThetaItemPartDefinition"),
+    ("MaterialParts", "MaterialPartData", "MaterialItemPartDefinition")
+]]
+
+# Item class -> Sanity Check Safeguard -> slice of PartsList that can be salvaged
+PartSlotRanges: Dict[str, Dict[str, Tuple[int, int]]] = {
+    "WillowWeapon": {"Safe": (0, 8), "Expert": (0, 8), "Insane": (0, 9)},
+    "WillowShield": {"Safe": (0, 4), "Expert": (0, 4), "Insane": (0, 4)},
+    "WillowArtifact": {"Safe": (7, 8), "Expert": (0, 8), "Insane": (0, 9)},
+    "WillowClassMod": {"Safe": (1, 9), "Expert": (0, 9), "Insane": (0, 9)},
+    "WillowGrenadeMod": {"Safe": (0, 8), "Expert": (0, 8), "Insane": (0, 9)},
+}
+
+# Item class -> (balance part collection, index of its slot name in PartsList)
+PartLookups: Dict[str, Tuple[str, int]] = {
+    "WillowWeapon": ("RuntimePartListCollection", 0),
+    "WillowShield": ("InventoryDefinition", 0),
+    "WillowArtifact": ("PartListCollection", 1),
+    "WillowClassMod": ("RuntimePartListCollection", 1),
+    "WillowGrenadeMod": ("PartListCollection", 1),
+}
+
+# RarityLevel -> (rarity rank, lowest rank it accepts parts from, rarity lock popup padding)
+RarityRanks: Dict[Game, Dict[int, Tuple[int, int, int]]] = {
+    Game.BL2 | Game.TPS: {
+        2: (1, 1, 24),
+        3: (2, 2, 34),
+    },
+    Game.BL2: {
+        4: (3, 3, 7),
+        6: (4, 3, 7),
+        **{rarityLevel: (5, 5, 18) for rarityLevel in range(7, 11)},
+        500: (6, 6, 29),
+        501: (7, 6, 29),
+        506: (8, 8, 48),
+    },
+    Game.TPS: {
+        4: (3, 3, 38),
+        6: (4, 3, 38),
+        **{rarityLevel: (5, 5, 50) for rarityLevel in range(7, 11)},
+        501: (9, 6, 60),
+    },
+}
+
+
+@lru_cache(maxsize=512)
+def get_part_names(part: UObject, showColour: bool, incompatible: bool) -> Tuple[str, str]:
+    # Redrawing the salvage menus asks for the same handful of names over and over, so both the
+    # formatted name and the font-stripped version are kept around instead of going back to Part Notifier
+    partName: str = get_single_part_name(part, showColour, incompatible)
+    return partName, FontTagPattern.sub("", partName)
+
 
 class SpareParts(SDKMod):
     Name: str = "Spare Parts"
@@ -24,7 +105,7 @@ class SpareParts(SDKMod):
         "Just select an item from your backpack, hover over another item " \
         "and press the 'salvage' hotkey. Default is [C]\n\n" \
         "Note: the item you salvage parts from will be destroyed in the process."
-    Version: str = "1.6"
+    Version: str = "1.7"
 
     SupportedGames: Game = Game.BL2 | Game.TPS
     Types: ModTypes = ModTypes.Utility
@@ -38,9 +119,15 @@ class SpareParts(SDKMod):
             "C",
             True,
         )
-        self.Keybinds = [self._salvageHotkey]
+        self._donorScanHotkey: Keybind = Keybind(
+            "Find Salvage Donors",
+            "V",
+            True,
+        )
+        self.Keybinds = [self._salvageHotkey, self._donorScanHotkey]
         self.UserInterface = SparePartsUI(self)
         self.Globals = FindObject("GlobalsDefinition", "GD_Globals.General.Globals")
+        self.RarityCache: Dict[int, int] = {}
 
         self.RarityLock = Options.Boolean(
             Caption="Rarity Lock",
@@ -79,7 +166,32 @@ class SpareParts(SDKMod):
         else:
             super().SettingsInputPressed(action)
 
+    def Enable(self) -> None:
+        self.UserInterface.clearPartIndex()
+        get_part_names.cache_clear()
+        self.UserInterface.buildRarityTable()
+        self.RarityCache.clear()
+        super().Enable()
+
+    def Disable(self) -> None:
+        self.UserInterface.releaseSession()
+        super().Disable()
+
+    # Packages may have been swapped out under us, so any cached part pools or part names could be stale
+    @Hook("WillowGame.WillowPlayerController.WillowClientDisableLoadingMovie")
+    @profile_hook("SpareParts._onMapLoaded")
+    def _onMapLoaded(
+        self,
+        caller: UObject,
+        function: UFunction,
+        params: FStruct,
+    ) -> bool:
+        self.UserInterface.clearPartIndex()
+        get_part_names.cache_clear()
+        return True
+
     @Hook("WillowGame.ItemInspectionGFxMovie.OnClose")
+    @profile_hook("SpareParts._inspectOnClose")
     def _inspectOnClose(
         self,
         caller: UObject,
@@ -88,10 +200,11 @@ class SpareParts(SDKMod):
     ) -> bool:
         if self.UserInterface.inspecting:
             self.UserInterface.inspecting = False
-            self.UserInterface.showGuidedReplacements()
+            self.UserInterface.GuidedBox.Show()
         return True
 
     @Hook("WillowGame.StatusMenuInventoryPanelGFxObject.SetTooltipText")
+    @profile_hook("SpareParts._setTooltipText")
     def _setTooltipText(
         self,
         caller: UObject,
@@ -115,6 +228,7 @@ class SpareParts(SDKMod):
         return False
 
     @Hook("WillowGame.StatusMenuInventoryPanelGFxObject.EquipInputKey")
+    @profile_hook("SpareParts._equipInputKey")
     def _equipInputKey(
         self,
         caller: UObject,
@@ -145,14 +259,12 @@ class SpareParts(SDKMod):
             if firstItem == secondItem:
                 return True
 
-            if self.StrictUniques.CurrentValue and firstItem.Class.Name != "WillowClassMod" \
-                and self.Globals.GetRarityForLevel(firstItem.RarityLevel if firstItem.RarityLevel != 500 else 501) >= 5\
-                    and firstItem.DefinitionData.BalanceDefinition != secondItem.DefinitionData.BalanceDefinition:
+            safeguardBlock: str = self.getSafeguardBlock(
+                firstItem, secondItem, firstItem.DefinitionData, secondItem.DefinitionData
+            )
+            if safeguardBlock == "StrictUniques":
                 self.UserInterface.showStrictUniques()
-
-            elif self.RarityLock.CurrentValue \
-                and self.Globals.GetRarityForLevel(secondItem.RarityLevel if secondItem.RarityLevel != 500 else 501) < \
-                    self.Globals.GetRarityForLevel(firstItem.RarityLevel if firstItem.RarityLevel != 500 else 501):
+            elif safeguardBlock == "RarityLock":
                 self.UserInterface.showRarityLock(firstItem.RarityLevel)
             else:
                 self.caller: UObject = caller
@@ -160,8 +272,41 @@ class SpareParts(SDKMod):
                 self.UserInterface.showUI()
             return False
 
+        if params.ukey == self._donorScanHotkey.Key:
+            firstItem: UObject = caller.EquippingThing if caller.bIsDoingEquip else caller.GetSelectedThing()
+            if firstItem is None:
+                return True
+            backpack: List[UObject] = GetEngine().GamePlayers[0].Actor.GetPawnInventoryManager().Backpack
+            self.UserInterface.showSalvageDonors(firstItem, self.UserInterface.findSalvageDonors(firstItem, backpack))
+            return False
+
         return True
 
+    def getSafeguardBlock(
+        self,
+        firstItem: UObject,
+        secondItem: UObject,
+        firstData: FStruct,
+        secondData: FStruct,
+    ) -> str:
+        if self.StrictUniques.CurrentValue and firstItem.Class.Name != "WillowClassMod" \
+            and self.getRarity(firstItem.RarityLevel) >= 5 \
+                and firstData.BalanceDefinition != secondData.BalanceDefinition:
+            return "StrictUniques"
+
+        if self.RarityLock.CurrentValue \
+                and self.getRarity(secondItem.RarityLevel) < self.getRarity(firstItem.RarityLevel):
+            return "RarityLock"
+
+        return ""
+
+    def getRarity(self, rarityLevel: int) -> int:
+        rarity = self.RarityCache.get(rarityLevel)
+        if rarity is None:
+            rarity = self.Globals.GetRarityForLevel(rarityLevel if rarityLevel != 500 else 501)
+            self.RarityCache[rarityLevel] = rarity
+        return rarity
+
     def InspectCustomItem(self, inspectableItem: UObject) -> None:
         self.caller.StartEquipPanel.InspectItem(inspectableItem)
 
@@ -174,27 +319,13 @@ class SparePartsUI():
     def __init__(self, owner) -> None:
         self.inspecting = False
         self.owner = owner
-        self.PartsList: List[List[Tuple[str, str, str]]] = [[  # Weapon Parts
-            ("Accessory1PartData", "Accessory1PartDefinition", ""),
-            ("Accessory2PartData", "Accessory2PartDefinition", ""),
-            ("BarrelPartData", "BarrelPartDefinition", ""),
-            ("BodyPartData", "BodyPartDefinition", ""),
-            ("ElementalPartData", "ElementalPartDefinition", ""),
-            ("GripPartData", "GripPartDefinition", ""),
-            ("SightPartData", "SightPartDefinition", ""),
-            ("StockPartData", "StockPartDefinition", ""),
-            ("MaterialPartData", "MaterialPartDefinition", "")
-        ], [  # Item Parts
-            ("AlphaParts", "AlphaPartData", "AlphaItemPartDefinition"),
-            ("BetaParts", "BetaPartData", "BetaItemPartDefinition"),
-            ("GammaParts", "GammaPartData", "GammaItemPartDefinition"),
-            ("DeltaParts", "DeltaPartData", "DeltaItemPartDefinition"),
-            ("EpsilonParts", "EpsilonPartData", "EpsilonItemPartDefinition"),
-            ("ZetaParts", "ZetaPartData", "ZetaItemPartDefinition"),
-            ("EtaParts", "EtaPartData", "EtaItemPartDefinition"),
-            ("ThetaParts", "ThetaPartData", "ThetaItemPartDefinition"),
-            ("MaterialParts", "MaterialPartData", "MaterialItemPartDefinition")
-        ]]
+        self.partIndex: Dict[Tuple[UObject, str, str], FrozenSet[UObject]] = {}
+        self.combinedItemDirty: bool = False
+        self.skippedInitializations: int = 0
+        self.combinedItem: UObject = None
+        self.previewItem: UObject = None
+        self.previewStale: bool = True
+        self.orphanedClones: List[UObject] = []
         self.BL2Rarities: List[str] = [
             "<font color='#ffffff'>Common</font>",
             "<font color='#3dd20b'>Uncommon</font>",
@@ -215,38 +346,36 @@ class SparePartsUI():
             "<font color='#ffb300'>Legendary</font>",
             "<font color='#ffa4e7'>Glitch</font>"
         ]
-
-    def get_available_parts(self, attr: FStruct) -> List:
-        return [x.Part for x in attr] if attr else []
+        self.buildRarityTable()
+
+    def get_available_parts(self, balance: UObject, collection: str, slot: str) -> FrozenSet[UObject]:
+        """
+        Part pools are read from the balance once and then kept in a lookup set, as walking WeightedParts
+        through the SDK on every salvage press gets slow with heavily modded part lists.
+        """
+        key = (balance, collection, slot)
+        parts = self.partIndex.get(key)
+        if parts is None:
+            weightedParts = getattr(getattr(balance, collection), slot).WeightedParts
+            parts = frozenset(x.Part for x in weightedParts) if weightedParts else frozenset()
+            self.partIndex[key] = parts
+        return parts
+
+    def clearPartIndex(self) -> None:
+        self.partIndex.clear()
+
+    def partNameCacheInfo(self) -> Any:
+        # A miss is a call into Part Notifier, so this should stay flat while toggling parts in the guided menu
+        return get_part_names.cache_info()
+
+    def buildRarityTable(self) -> None:
+        self.RarityTable: Dict[int, Tuple[int, int, int]] = {
+            **RarityRanks[Game.BL2 | Game.TPS],
+            **RarityRanks.get(Game.GetCurrent(), {})
+        }
 
     def getRarityRankFromLevel(self, rarityLevel: int) -> Tuple[int, int, int]:
-        if rarityLevel == 2:
-            return (1, 1, 24)
-        elif rarityLevel == 3:
-            return (2, 2, 34)
-        elif Game.GetCurrent() == Game.BL2:
-            if rarityLevel == 4:
-                return (3, 3, 7)
-            elif rarityLevel == 6:
-                return (4, 3, 7)
-            elif rarityLevel >= 7 and rarityLevel <= 10:
-                return (5, 5, 18)
-            elif rarityLevel == 500:
-                return (6, 6, 29)
-            elif rarityLevel == 501:
-                return (7, 6, 29)
-            elif rarityLevel == 506:
-                return (8, 8, 48)
-        elif Game.GetCurrent() == Game.TPS:
-            if rarityLevel == 4:
-                return (3, 3, 38)
-            elif rarityLevel == 6:
-                return (4, 3, 38)
-            elif rarityLevel >= 7 and rarityLevel <= 10:
-                return (5, 5, 50)
-            elif rarityLevel == 501:
-                return (9, 6, 60)
-        return (9, 6, 60)
+        return self.RarityTable.get(rarityLevel, (9, 6, 60))
 
     def showRarityLock(self, firstItemRarityLevel: int) -> None:
         acceptableRarities: str = ""
@@ -285,101 +414,142 @@ class SparePartsUI():
                     + "try unequipping it and trying again\n\n\n".rjust(69)).Show()
 
     def selectInventoryItems(self, firstItem: UObject, secondItem: UObject):
-        self.swappableParts: List = []
-        self.incompatibleParts: List = []
+        self.releaseSession()
         self.guidedBoxButtons: List[OptionBoxButton] = []
         self.firstItem: UObject = firstItem
         self.secondItem: UObject = secondItem
-        self.combinedItem: UObject = firstItem.CreateClone()
-
-        if firstItem.Class.Name == "WillowWeapon":
-            i = 9 if self.owner.SanityCheckSafeguard.CurrentValue == "Insane" else 8
-            for part in self.PartsList[0][0:i]:
-                firstItemPart: UObject = getattr(firstItem.DefinitionData, part[1])
-                secondItemPart: UObject = getattr(secondItem.DefinitionData, part[1])
-                if self.owner.SanityCheckSafeguard.CurrentValue == "Insane":
+        self.combinedItem = firstItem.CreateClone()
+        self.combinedItemDirty = False
+        self.swappableParts, self.incompatibleParts = self.findParts(
+            firstItem.Class.Name,
+            firstItem.DefinitionData,
+            secondItem.DefinitionData,
+            self.owner.SanityCheckSafeguard.CurrentValue
+        )
+
+    def findParts(self, className: str, firstData: FStruct, secondData: FStruct, safeguard: str) -> Tuple[List, List]:
+        swappableParts: List = []
+        incompatibleParts: List = []
+        if className not in PartSlotRanges:
+            return swappableParts, incompatibleParts
+
+        i, j = PartSlotRanges[className][safeguard]
+        partLookup: Tuple[str, int] = PartLookups[className]
+
+        if className == "WillowWeapon":
+            for part in PartsList[0][i:j]:
+                firstItemPart: UObject = getattr(firstData, part[1])
+                secondItemPart: UObject = getattr(secondData, part[1])
+                if safeguard == "Insane":
                     if firstItemPart is None and secondItemPart is None:
                         continue
                 else:
                     if secondItemPart is None:
                         continue
                     if firstItemPart is None:
-                        self.incompatibleParts.append(secondItemPart)
+                        incompatibleParts.append(secondItemPart)
                         continue
 
-                if self.owner.SanityCheckSafeguard.CurrentValue == "Insane" \
-                    and firstItem.DefinitionData.WeaponTypeDefinition.WeaponType == \
-                        secondItem.DefinitionData.WeaponTypeDefinition.WeaponType \
+                if safeguard == "Insane" \
+                    and firstData.WeaponTypeDefinition.WeaponType == secondData.WeaponTypeDefinition.WeaponType \
                         or secondItemPart in self.get_available_parts(
-                        getattr(
-                            getattr(
-                                firstItem.DefinitionData.BalanceDefinition.RuntimePartListCollection,
-                                part[0]
-                            ),
-                            "WeightedParts")
+                            firstData.BalanceDefinition,
+                            partLookup[0],
+                            part[partLookup[1]]
                         ):
-                    self.swappableParts.append([firstItemPart, secondItemPart, part[1], 0])
+                    swappableParts.append([firstItemPart, secondItemPart, part[1], 0])
                 else:
-                    self.incompatibleParts.append(secondItemPart)
+                    incompatibleParts.append(secondItemPart)
 
         else:
-            if firstItem.Class.Name == "WillowShield":
-                i = 0
-                j = 4
-                """
-                A couple shields use PartListCollection instead of InventoryDefinition, but still have a valid
-                AlphaParts declared under InventoryDefinition. This check just reroutes those edge cases.
-                """
-                if firstItem.DefinitionData.BalanceDefinition.InventoryDefinition.BetaParts is not None:
-                    partLookup: Tuple[str, int] = ("InventoryDefinition", 0)
-                else:
-                    partLookup: Tuple[str, int] = ("PartListCollection", 1)
-
-            elif firstItem.Class.Name == "WillowArtifact":
-                i = 0 if self.owner.SanityCheckSafeguard.CurrentValue != "Safe" else 7
-                j = 9 if self.owner.SanityCheckSafeguard.CurrentValue == "Insane" else 8
-                partLookup: Tuple[str, int] = ("PartListCollection", 1)
-
-            elif firstItem.Class.Name == "WillowClassMod":
-                i = 0 if self.owner.SanityCheckSafeguard.CurrentValue != "Safe" else 1
-                j = 9
-                partLookup: Tuple[str, int] = ("RuntimePartListCollection", 1)
-
-            elif firstItem.Class.Name == "WillowGrenadeMod":
-                i = 0
-                j = 9 if self.owner.SanityCheckSafeguard.CurrentValue == "Insane" else 8
-                partLookup: Tuple[str, int] = ("PartListCollection", 1)
-
-            for part in self.PartsList[1][i:j]:
-                firstItemPart: UObject = getattr(firstItem.DefinitionData, part[2])
+            """
+            A couple shields use PartListCollection instead of InventoryDefinition, but still have a valid
+            AlphaParts declared under InventoryDefinition. This check just reroutes those edge cases.
+            """
+            if className == "WillowShield" and firstData.BalanceDefinition.InventoryDefinition.BetaParts is None:
+                partLookup = ("PartListCollection", 1)
+
+            for part in PartsList[1][i:j]:
+                firstItemPart: UObject = getattr(firstData, part[2])
                 if firstItemPart is None:
                     continue
-                secondItemPart: UObject = getattr(secondItem.DefinitionData, part[2])
+                secondItemPart: UObject = getattr(secondData, part[2])
                 if secondItemPart is None:
                     continue
-                if self.owner.SanityCheckSafeguard.CurrentValue == "Insane" \
-                    or secondItemPart in self.get_available_parts(
-                        getattr(
-                            getattr(
-                                getattr(
-                                    firstItem.DefinitionData.BalanceDefinition,
-                                    partLookup[0]
-                                ),
-                                part[partLookup[1]]
-                            ),
-                            "WeightedParts"
-                        )
-                        ):
-                    self.swappableParts.append([firstItemPart, secondItemPart, part[2], 0])
+                compatible: bool = safeguard == "Insane" or secondItemPart in self.get_available_parts(
+                    firstData.BalanceDefinition,
+                    partLookup[0],
+                    part[partLookup[1]]
+                )
+                if compatible:
+                    swappableParts.append([firstItemPart, secondItemPart, part[2], 0])
                 else:
-                    self.incompatibleParts.append(secondItemPart)
+                    incompatibleParts.append(secondItemPart)
+
+        return swappableParts, incompatibleParts
+
+    def findSalvageDonors(self, firstItem: UObject, backpack: List[UObject]) -> List[Tuple[UObject, int]]:
+        className: str = firstItem.Class.Name
+        firstData: FStruct = firstItem.DefinitionData
+        safeguard: str = self.owner.SanityCheckSafeguard.CurrentValue
+        requiredClass: UObject = firstData.ItemDefinition.RequiredPlayerClass \
+            if className == "WillowClassMod" and safeguard != "Insane" else None
+
+        donors: List[Tuple[UObject, int]] = []
+        for item in backpack:
+            if item is None or item == firstItem or item.Class.Name != className:
+                continue
+            secondData: FStruct = item.DefinitionData
+            if requiredClass is not None and secondData.ItemDefinition.RequiredPlayerClass != requiredClass:
+                continue
+            if self.owner.getSafeguardBlock(firstItem, item, firstData, secondData):
+                continue
+
+            swappableParts = self.findParts(className, firstData, secondData, safeguard)[0]
+            partCount = sum(1 for parts in swappableParts if parts[0] != parts[1])
+            if partCount > 0:
+                donors.append((item, partCount))
+
+        donors.sort(key=lambda donor: donor[1], reverse=True)
+        return donors
+
+    def showSalvageDonors(self, firstItem: UObject, donors: List[Tuple[UObject, int]]) -> None:
+        if len(donors) == 0:
+            TrainingBox("<font color=\"#dc4646\">No Salvage Donors</font>",
+                        "\n\n\n" + "No items in your backpack have parts that can be salvaged\n".rjust(65)
+                        + f"onto your {firstItem.GetShortHumanReadableName()}\n\n\n".rjust(65)).Show()
+            return
+
+        donorsCaption: str = "\n".join(
+            f"    {item.GetShortHumanReadableName()}  <font color=\"#708090\">"
+            f"{partCount} part{'s' if partCount > 1 else ''}</font>"
+            for item, partCount in donors[:10]
+        )
+        if len(donors) > 10:
+            donorsCaption += f"\n    <font color=\"#708090\">...and {len(donors) - 10} more</font>"
+
+        TrainingBox(
+            f"Salvage Donors [{self.owner.SanityCheckSafeguard.CurrentValue} Mode]",
+            f"<font color=\"#35fc3d\">Best donors for {firstItem.GetShortHumanReadableName()}:</font>\n"
+            + donorsCaption
+        ).Show()
 
     def replacePart(self, button: OptionBoxButton):
-        partLocation: List = self.swappableParts[self.guidedBoxButtons.index(button)]
+        buttonIndex: int = self.guidedBoxButtons.index(button)
+        partLocation: List = self.swappableParts[buttonIndex]
         partLocation[3] = 1 - partLocation[3]
         setattr(self.combinedItem.DefinitionData, partLocation[2], partLocation[partLocation[3]])
-        self.combinedItem.InitializeInternal(True)
-        self.showGuidedReplacements(self.guidedBoxButtons.index(button))
+        # Initializing is deferred until the item is inspected or confirmed, so a run of toggles only pays for one
+        if self.combinedItemDirty:
+            self.skippedInitializations += 1
+        self.combinedItemDirty = True
+        self.previewStale = True
+        self.updateGuidedReplacement(buttonIndex)
+
+    def initializeCombinedItem(self) -> None:
+        if self.combinedItemDirty:
+            self.combinedItem.InitializeInternal(True)
+            self.combinedItemDirty = False
 
     def confirmGuidedReplacements(self, key: str, event: int):
         if event == KeybindManager.InputEvent.Pressed:
@@ -387,80 +557,104 @@ class SparePartsUI():
                 self.GuidedBox.Hide()
 
                 inventory_manager: UObject = GetEngine().GamePlayers[0].Actor.GetPawnInventoryManager()
+                self.initializeCombinedItem()
                 self.combinedItem.DefinitionData.UniqueId = self.combinedItem.GenerateUniqueID()
-                inventory_manager.AddBackpackInventory(self.combinedItem.CreateClone())
+                # The backpack takes ownership of the working item, so it must not be released with the session
+                inventory_manager.AddBackpackInventory(self.combinedItem)
+                self.combinedItem = None
                 inventory_manager.RemoveInventoryFromBackpack(self.firstItem)
                 inventory_manager.RemoveInventoryFromBackpack(self.secondItem)
                 inventory_manager.UpdateBackpackInventoryCount()
+                self.releaseSession()
 
                 self.owner.EscapeCompareMenu()
 
             if key == "F":
                 self.inspecting = True
-                self.owner.InspectCustomItem(self.combinedItem.CreateClone())
+                self.owner.InspectCustomItem(self.getPreviewItem())
                 self.GuidedBox.Hide()
 
+    def getPreviewItem(self) -> UObject:
+        self.initializeCombinedItem()
+        if self.previewItem is None:
+            self.previewItem = self.combinedItem.CreateClone()
+        elif self.previewStale:
+            self.previewItem.DefinitionData = self.combinedItem.DefinitionData
+            self.previewItem.InitializeInternal(True)
+        self.previewStale = False
+        return self.previewItem
+
+    def cancelGuidedReplacements(self) -> None:
+        self.releaseSession()
+
+    def releaseSession(self) -> None:
+        # Any clones left over from a session that wasn't confirmed are never added to an inventory
+        # manager, so they have to be destroyed here or they linger until the next map load
+        if self.combinedItem is not None:
+            self.orphanedClones.append(self.combinedItem)
+            self.combinedItem = None
+        if self.previewItem is not None:
+            self.orphanedClones.append(self.previewItem)
+            self.previewItem = None
+        self.previewStale = True
+
+        for clone in self.orphanedClones:
+            clone.Destroy()
+        self.orphanedClones.clear()
+
+    def getGuidedRow(self, parts: List) -> Tuple[str, str]:
+        if parts[1 - parts[3]] is None:
+            buttonName = "No " + PartPrefixPattern.sub("", get_part_names(parts[parts[3]], True, False)[1])
+        else:
+            buttonName = get_part_names(parts[1 - parts[3]], True, False)[1]
+
+        if parts[parts[3]] is None:
+            captionName = "No " + PartPrefixPattern.sub("", get_part_names(parts[1 - parts[3]], True, False)[1])
+        else:
+            captionName = get_part_names(parts[parts[3]], True, False)[0]
+
+        return f"Salvage {buttonName}", f"<font color=\"#ffe6cc\">  {captionName}</font>"
+
+    def getGuidedCaption(self) -> str:
+        captions: List[str] = self.guidedBoxCaptions
+        if len(captions) <= 5:
+            return "".join(caption + "\n" for caption in captions)
+
+        rows: int = len(captions) - 5
+        lines: List[str] = [captions[i].ljust(70) + captions[i + 5] for i in range(rows)] + captions[rows:5]
+        return "\n".join(lines) + "\n"
+
     def showGuidedReplacements(self, selectedButtonIndex: int = 0):
-        GuidedBoxCaption: str = ""
-        GuidedBoxCaptionList: List[str] = []
         self.guidedBoxButtons.clear()
-        partname: str
+        self.guidedBoxCaptions: List[str] = []
         for parts in self.swappableParts:
-            if parts[1 - parts[3]] is None:
-                partName = re.sub(
-                    r"<(\/){0,1}font( color=(\"|\')#[0-z]{6}(\"|\')){0,1}>",
-                    "",
-                    get_single_part_name(parts[parts[3]], True, False)
-                )
-                partName = "No " + re.sub(".* ", "", partName)
-            else:
-                partName = re.sub(
-                    r"<(\/){0,1}font( color=(\"|\')#[0-z]{6}(\"|\')){0,1}>",
-                    "",
-                    get_single_part_name(parts[1 - parts[3]], True, False)
-                )
-            self.guidedBoxButtons.append(OptionBoxButton(f"Salvage {partName}"))
-            if parts[parts[3]] is None:
-                partName = re.sub(
-                    r"<(\/){0,1}font( color=(\"|\')#[0-z]{6}(\"|\')){0,1}>",
-                    "",
-                    get_single_part_name(parts[1 - parts[3]], True, False)
-                )
-                partname = "No " + re.sub(".* ", "", partName)
-                GuidedBoxCaptionList.append(
-                    f"<font color=\"#ffe6cc\">  {partname}</font>"
-                )
-            else:
-                GuidedBoxCaptionList.append(
-                    f"<font color=\"#ffe6cc\">  {get_single_part_name(parts[parts[3]], True, False)}</font>"
-                )
-
-        if len(self.swappableParts) <= 5:
-            for Caption in GuidedBoxCaptionList:
-                GuidedBoxCaption += Caption + "\n"
-        else:
-            i = 0
-            while i < len(self.swappableParts) - 5:
-                GuidedBoxCaption += GuidedBoxCaptionList[i].ljust(70) + GuidedBoxCaptionList[i+5] + "\n"
-                i += 1
-            for Caption in GuidedBoxCaptionList[i:5]:
-                GuidedBoxCaption += Caption + "\n"
+            buttonName, caption = self.getGuidedRow(parts)
+            self.guidedBoxButtons.append(OptionBoxButton(buttonName))
+            self.guidedBoxCaptions.append(caption)
 
         self.GuidedBox = OptionBox(
             Title="Current Parts",
-            Caption=GuidedBoxCaption,
+            Caption=self.getGuidedCaption(),
             Buttons=self.guidedBoxButtons,
             Tooltip=f"[Enter] Select    [Escape] Cancel    [{self.owner._salvageHotkey.Key}] Confirm    [F] Inspect"
         )
         self.GuidedBox.OnInput = self.confirmGuidedReplacements
         self.GuidedBox.OnPress = self.replacePart
+        self.GuidedBox.OnCancel = self.cancelGuidedReplacements
         self.GuidedBox.Show(self.guidedBoxButtons[selectedButtonIndex])
 
+    def updateGuidedReplacement(self, buttonIndex: int) -> None:
+        # Only the toggled row changes, so patch that button and caption line and reuse the existing box
+        button: OptionBoxButton = self.guidedBoxButtons[buttonIndex]
+        button.Name, self.guidedBoxCaptions[buttonIndex] = self.getGuidedRow(self.swappableParts[buttonIndex])
+        self.GuidedBox.Caption = self.getGuidedCaption()
+        self.GuidedBox.Show(button)
+
     def showUI(self):
         foundPartsPopupCaption: str = "<font color=\"#35fc3d\">Compatible:</font>\n"
         for parts in self.swappableParts[:]:
             if parts[1] is not None:
-                foundPartsPopupCaption += f"    {get_single_part_name(parts[1], True, False)}"
+                foundPartsPopupCaption += f"    {get_part_names(parts[1], True, False)[0]}"
                 if parts[0] == parts[1]:
                     foundPartsPopupCaption += "  <font color=\"#708090\">DUPLICATE PART</font>"
                     self.swappableParts.remove(parts)
@@ -470,7 +664,7 @@ class SparePartsUI():
             foundPartsPopupCaption += "\n<font color=\"#dc4646\">Incompatible:</font>\n"
             for part in self.incompatibleParts:
                 if part is not None:
-                    foundPartsPopupCaption += f"    {get_single_part_name(part, True, True)}\n"
+                    foundPartsPopupCaption += f"    {get_part_names(part, True, True)[0]}\n"
 
         if self.firstItem.Class.Name == "WillowClassMod" \
             and self.owner.SanityCheckSafeguard.CurrentValue != "Insane" \
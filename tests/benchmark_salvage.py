@@ -0,0 +1,104 @@
+"""
+Times the Spare Parts salvage stages against the stubbed engine, for every item class and Sanity Check Safeguard
+mode, over synthetic part pools of increasing size. Results are written as json so runs from different versions
+can be diffed:
+
+    python tests/benchmark_salvage.py --output salvage_benchmark.json
+"""
+import argparse
+import json
+import sys
+from statistics import mean, median
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Sequence
+
+import item_graphs
+import unrealsdk
+from harness import load_mod
+
+Stages: Sequence[str] = ("selectInventoryItems", "showUI", "showGuidedReplacements")
+Safeguards: Sequence[str] = ("Safe", "Expert", "Insane")
+PoolSizes: Sequence[int] = (10, 100, 1000, 10000)
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    start = perf_counter()
+    func()
+    return (perf_counter() - start) * 1000
+
+
+def run_benchmark(
+    poolSizes: Sequence[int] = PoolSizes,
+    runs: int = 20,
+    classNames: Sequence[str] = item_graphs.ItemClasses,
+    safeguards: Sequence[str] = Safeguards,
+) -> Dict[str, Any]:
+    unrealsdk.Engine.GamePlayers = [item_graphs.make_local_player()]
+    SpareParts = load_mod("SpareParts")
+    UserFeedback = load_mod("UserFeedback")
+    instance = SpareParts.instance
+    userInterface = instance.UserInterface
+
+    results: List[Dict[str, Any]] = []
+    for className in classNames:
+        for poolSize in poolSizes:
+            balance = item_graphs.Balance(className, poolSize)
+            # Every slot differs, so each stage has the most parts it can have to deal with
+            firstItem = item_graphs.make_item(balance, balance.parts(0))
+            secondItem = item_graphs.make_item(balance, balance.parts(poolSize - 1))
+            for safeguard in safeguards:
+                instance.SanityCheckSafeguard.CurrentValue = safeguard
+                durations: Dict[str, List[float]] = {stage: [] for stage in Stages}
+                swappableParts = 0
+                for _ in range(runs):
+                    # Timed as the first salvage after a map load, which is when the caches are empty
+                    userInterface.clearPartIndex()
+                    SpareParts.get_part_names.cache_clear()
+                    UserFeedback.Shown.clear()
+                    durations["selectInventoryItems"].append(
+                        time_call(lambda: userInterface.selectInventoryItems(firstItem, secondItem))
+                    )
+                    durations["showUI"].append(time_call(userInterface.showUI))
+                    swappableParts = len(userInterface.swappableParts)
+                    if swappableParts:
+                        durations["showGuidedReplacements"].append(time_call(userInterface.showGuidedReplacements))
+                    userInterface.releaseSession()
+
+                for stage, stageDurations in durations.items():
+                    if not stageDurations:
+                        continue
+                    results.append({
+                        "class": className,
+                        "safeguard": safeguard,
+                        "poolSize": poolSize,
+                        "stage": stage,
+                        "swappableParts": swappableParts,
+                        "runs": len(stageDurations),
+                        "meanMs": mean(stageDurations),
+                        "medianMs": median(stageDurations),
+                        "maxMs": max(stageDurations),
+                    })
+
+    instance.SanityCheckSafeguard.CurrentValue = instance.SanityCheckSafeguard.StartingValue
+    unrealsdk.Engine.GamePlayers = []
+    return {"version": instance.Version, "python": sys.version.split()[0], "runs": runs, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(PoolSizes), help="part pool sizes to run")
+    parser.add_argument("--runs", type=int, default=20, help="repetitions per class, safeguard and pool size")
+    parser.add_argument("--output", help="file to write the json results to, defaults to stdout")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.sizes, args.runs)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from typing import Any, Iterator
+
+import item_graphs
+import pytest
+import unrealsdk
+from harness import UserFeedback, load_mod
+
+
+@pytest.fixture
+def engine() -> Iterator[Any]:
+    unrealsdk.Engine.GamePlayers = [item_graphs.make_local_player()]
+    unrealsdk.WorldInfo.ControllerList = unrealsdk.Engine.GamePlayers[0].Actor
+    unrealsdk.Hooks.clear()
+    unrealsdk.Logs.clear()
+    yield unrealsdk.Engine
+    unrealsdk.Engine.GamePlayers = []
+    unrealsdk.WorldInfo.ControllerList = None
+
+
+@pytest.fixture
+def shown() -> Iterator[list]:
+    UserFeedback.Shown.clear()
+    yield UserFeedback.Shown
+    UserFeedback.Shown.clear()
+
+
+@pytest.fixture
+def spare_parts(engine: Any, shown: list) -> Iterator[Any]:
+    instance = load_mod("SpareParts").instance
+    for option in instance.Options:
+        option.CurrentValue = option.StartingValue
+    instance.Enable()
+    yield instance
+    instance.Disable()
@@ -0,0 +1,40 @@
+"""
+Loads the mods the same way the SDK does, as subpackages of a Mods package, except that the SDK's own modules
+(unrealsdk, ModMenu, UserFeedback, PythonPartNotifier, Structs) come from the stand-ins in tests/stubs. Shared by
+the pytest suite and the benchmarks.
+"""
+import importlib
+import os
+import sys
+import types
+from typing import Dict
+
+TestsDir: str = os.path.dirname(os.path.abspath(__file__))
+StubsDir: str = os.path.join(TestsDir, "stubs")
+RepoDir: str = os.path.dirname(TestsDir)
+
+for path in (TestsDir, StubsDir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+if "Mods" not in sys.modules:
+    ModsPackage = types.ModuleType("Mods")
+    ModsPackage.__path__ = [RepoDir, StubsDir]  # type: ignore
+    sys.modules["Mods"] = ModsPackage
+
+import unrealsdk  # noqa: E402
+
+# RarityLevel -> rarity, matching what GD_Globals hands back in BL2
+Rarities: Dict[int, int] = {1: 0, 2: 1, 3: 2, 4: 3, 6: 4, 7: 5, 8: 5, 9: 5, 10: 5, 501: 6, 506: 8}
+
+# Spare Parts looks up the rarity globals while it's being constructed, so they have to exist before the import
+unrealsdk.Objects["GD_Globals.General.Globals"] = unrealsdk.UObject(
+    "GlobalsDefinition", "Globals", GetRarityForLevel=lambda level: Rarities.get(level, 0)
+)
+
+
+def load_mod(name: str) -> types.ModuleType:
+    return importlib.import_module(f"Mods.{name}")
+
+
+# The mods import their dependencies relative to Mods, so the stubs have to be reached the same way to be shared
+UserFeedback = load_mod("UserFeedback")
@@ -0,0 +1,147 @@
+"""
+Builders for fake item and balance object graphs, shaped like the ones the game hands to Spare Parts. Each item
+class hangs its part pools off a different balance collection, under differently named slots.
+"""
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+import harness  # noqa: F401
+from unrealsdk import FStruct, UObject
+
+WeaponSlots: Tuple[Tuple[str, str], ...] = (
+    ("Accessory1PartDefinition", "Accessory1PartData"),
+    ("Accessory2PartDefinition", "Accessory2PartData"),
+    ("BarrelPartDefinition", "BarrelPartData"),
+    ("BodyPartDefinition", "BodyPartData"),
+    ("ElementalPartDefinition", "ElementalPartData"),
+    ("GripPartDefinition", "GripPartData"),
+    ("SightPartDefinition", "SightPartData"),
+    ("StockPartDefinition", "StockPartData"),
+    ("MaterialPartDefinition", "MaterialPartData"),
+)
+ItemSlotNames: Tuple[str, ...] = ("Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta", "Material")
+
+# Item class -> (balance collection holding the part pools, (item part attribute, pool slot) per part)
+ItemLayouts: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    "WillowWeapon": ("RuntimePartListCollection", WeaponSlots),
+    "WillowShield": ("InventoryDefinition", tuple(
+        (f"{slot}ItemPartDefinition", f"{slot}Parts") for slot in ItemSlotNames
+    )),
+    "WillowArtifact": ("PartListCollection", tuple(
+        (f"{slot}ItemPartDefinition", f"{slot}PartData") for slot in ItemSlotNames
+    )),
+    "WillowClassMod": ("RuntimePartListCollection", tuple(
+        (f"{slot}ItemPartDefinition", f"{slot}PartData") for slot in ItemSlotNames
+    )),
+    "WillowGrenadeMod": ("PartListCollection", tuple(
+        (f"{slot}ItemPartDefinition", f"{slot}PartData") for slot in ItemSlotNames
+    )),
+}
+ItemClasses: Tuple[str, ...] = tuple(ItemLayouts)
+
+ObjectIds = count()
+
+
+def make_part(name: str) -> UObject:
+    return UObject("ItemPartDefinition", name)
+
+
+def make_collection(slots: Dict[str, List[UObject]]) -> UObject:
+    return UObject("ItemPartListCollectionDefinition", f"Collection_{next(ObjectIds)}", **{
+        slot: FStruct(WeightedParts=[FStruct(Part=part) for part in parts]) for slot, parts in slots.items()
+    })
+
+
+class Balance:
+    """
+    A balance with a pool of parts for every slot its item class has, Pools maps each item part attribute to the
+    parts that are allowed in it.
+    """
+    def __init__(self, className: str, poolSize: int = 3, reroutedShield: bool = False) -> None:
+        self.ClassName: str = className
+        collection, slots = ItemLayouts[className]
+        self.Pools: Dict[str, List[UObject]] = {
+            attribute: [make_part(f"{className}.{attribute}.{i}") for i in range(poolSize)]
+            for attribute, _ in slots
+        }
+        pools = {slot: self.Pools[attribute] for attribute, slot in slots}
+        self.Definition: UObject = UObject("InventoryBalanceDefinition", f"{className}_Balance_{next(ObjectIds)}")
+        if reroutedShield:
+            # A couple of shields only declare AlphaParts under their InventoryDefinition
+            self.Definition.InventoryDefinition = make_collection({"AlphaParts": pools["AlphaParts"]})
+            self.Definition.InventoryDefinition.BetaParts = None
+            self.Definition.PartListCollection = make_collection({
+                f"{slot}PartData": self.Pools[f"{slot}ItemPartDefinition"] for slot in ItemSlotNames
+            })
+        else:
+            setattr(self.Definition, collection, make_collection(pools))
+
+    def part(self, attribute: str, index: int = 0) -> UObject:
+        return self.Pools[attribute][index]
+
+    def parts(self, index: int = 0) -> Dict[str, UObject]:
+        return {attribute: pool[index] for attribute, pool in self.Pools.items()}
+
+
+def make_item(
+    balance: Balance,
+    parts: Optional[Dict[str, Optional[UObject]]] = None,
+    rarityLevel: int = 3,
+    weaponType: int = 0,
+    requiredClass: Any = None,
+    equipped: bool = False,
+) -> UObject:
+    className = balance.ClassName
+    if parts is None:
+        parts = balance.parts()
+    data = FStruct(
+        BalanceDefinition=balance.Definition,
+        **{attribute: parts.get(attribute) for attribute, _ in ItemLayouts[className][1]}
+    )
+    item = UObject(className, f"{className}_{next(ObjectIds)}", DefinitionData=data, RarityLevel=rarityLevel)
+    if className == "WillowWeapon":
+        data.WeaponTypeDefinition = FStruct(WeaponType=weaponType)
+        item.AmmoPool = FStruct(PoolManager=UObject("AmmoPoolManager") if equipped else None)
+    else:
+        data.ItemDefinition = FStruct(RequiredPlayerClass=requiredClass)
+    item.IsEquipped = lambda: equipped
+    item.GetShortHumanReadableName = lambda: item.Name
+    item.InitializeInternal = lambda bInitDefaults: None
+    item.GenerateUniqueID = lambda: next(ObjectIds)
+    item.Destroyed = False
+
+    def CreateClone() -> UObject:
+        return make_item(balance, dict(vars(item.DefinitionData)), rarityLevel, weaponType, requiredClass)
+
+    def Destroy() -> None:
+        item.Destroyed = True
+
+    item.CreateClone = CreateClone
+    item.Destroy = Destroy
+    return item
+
+
+def make_local_player() -> Any:
+    inventoryManager = UObject("WillowInventoryManager", "InventoryManager", Backpack=[])
+    PC = UObject(
+        "WillowPlayerController",
+        "PlayerController",
+        GetPawnInventoryManager=lambda: inventoryManager,
+        WorldInfo=FStruct(TimeSeconds=0.),
+        PlayerClass=None,
+        NextController=None,
+    )
+    return FStruct(Actor=PC, Origin=FStruct(X=0., Y=0.), Size=FStruct(X=1., Y=1.))
+
+
+def make_inventory_panel(firstItem: Optional[UObject], selectedItem: Optional[UObject]) -> UObject:
+    # The status menu's inventory panel, partway through comparing firstItem against selectedItem
+    return UObject(
+        "StatusMenuInventoryPanelGFxObject",
+        "InventoryPanel",
+        bInitialSetupFinished=True,
+        bInEquippedView=False,
+        bIsDoingEquip=firstItem is not None,
+        EquippingThing=firstItem,
+        GetSelectedThing=lambda: selectedItem,
+    )
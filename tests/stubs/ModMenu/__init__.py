@@ -0,0 +1,122 @@
+"""
+A stand-in for the SDK's ModMenu, covering the parts of its API the mods in this repo use.
+"""
+import enum
+from typing import Any, Callable, Dict, List, Sequence
+
+
+class Game(enum.Flag):
+    BL2 = enum.auto()
+    TPS = enum.auto()
+    AoDK = enum.auto()
+
+    @staticmethod
+    def GetCurrent() -> "Game":
+        return CurrentGame
+
+
+CurrentGame: Game = Game.BL2
+
+
+class ModTypes(enum.Flag):
+    NONE = 0
+    Utility = enum.auto()
+    Content = enum.auto()
+    Gameplay = enum.auto()
+    Library = enum.auto()
+
+
+class EnabledSaveType(enum.Enum):
+    NotSaved = enum.auto()
+    LoadWithSettings = enum.auto()
+    LoadOnMainMenu = enum.auto()
+
+
+class KeybindManager:
+    class InputEvent(enum.IntEnum):
+        Pressed = 0
+        Released = 1
+        Repeat = 2
+        DoubleClick = 3
+        Axis = 4
+
+
+class Keybind:
+    def __init__(self, Name: str, Key: str = "None", IsRebindable: bool = True, IsHidden: bool = False) -> None:
+        self.Name: str = Name
+        self.Key: str = Key
+        self.IsRebindable: bool = IsRebindable
+        self.IsHidden: bool = IsHidden
+
+
+class Options:
+    class Base:
+        def __init__(self, Caption: str, Description: str = "", StartingValue: Any = None, **kwargs: Any) -> None:
+            self.Caption: str = Caption
+            self.Description: str = Description
+            self.StartingValue: Any = StartingValue
+            self.CurrentValue: Any = StartingValue
+            self.__dict__.update(kwargs)
+
+    class Boolean(Base):
+        pass
+
+    class Spinner(Base):
+        Choices: Sequence[str]
+
+    class Slider(Base):
+        MinValue: int
+        MaxValue: int
+
+    class Nested(Base):
+        def __init__(self, Caption: str, Description: str = "", Children: Sequence[Any] = (), **kwargs: Any) -> None:
+            super().__init__(Caption, Description, **kwargs)
+            self.Children: Sequence[Any] = Children
+
+
+def Hook(target: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func.HookTargets = getattr(func, "HookTargets", []) + [target]  # type: ignore
+        return func
+    return decorator
+
+
+class SDKMod:
+    Name: str = ""
+    Author: str = ""
+    Description: str = ""
+    Version: str = ""
+    SupportedGames: Game = Game.BL2 | Game.TPS
+    Types: ModTypes = ModTypes.NONE
+    SaveEnabledState: EnabledSaveType = EnabledSaveType.NotSaved
+    SettingsInputs: Dict[str, str] = {"Enter": "Enable"}
+    Options: List[Any] = []
+    Keybinds: List[Any] = []
+    IsEnabled: bool = False
+
+    def __init__(self) -> None:
+        pass
+
+    def Enable(self) -> None:
+        self.IsEnabled = True
+
+    def Disable(self) -> None:
+        self.IsEnabled = False
+
+    def SettingsInputPressed(self, action: str) -> None:
+        pass
+
+    def ModOptionChanged(self, option: Any, new_value: Any) -> None:
+        pass
+
+
+Mods: List[SDKMod] = []
+SavedSettings: List[SDKMod] = []
+
+
+def RegisterMod(mod: SDKMod) -> None:
+    Mods.append(mod)
+
+
+def SaveModSettings(mod: SDKMod) -> None:
+    SavedSettings.append(mod)
@@ -0,0 +1,10 @@
+from typing import Any, List
+
+Lookups: List[Any] = []
+
+
+def get_single_part_name(part: Any, showColour: bool, incompatible: bool) -> str:
+    Lookups.append(part)
+    if showColour:
+        return f"<font color='{'#dc4646' if incompatible else '#ffffff'}'>{part.Name}</font>"
+    return part.Name
@@ -0,0 +1,20 @@
+from typing import Any, NamedTuple
+
+
+class AttributeInitializationData(NamedTuple):
+    BaseValueConstant: float = 0.
+    BaseValueAttribute: Any = None
+    InitializationDefinition: Any = None
+    BaseValueScaleConstant: float = 1.
+
+
+class SkillEffectData(NamedTuple):
+    AttributeToModify: Any = None
+    bIncludeDuringAttributeNotifications: bool = False
+    EffectTarget: int = 0
+    ModifierType: int = 0
+    BaseModifierValue: Any = None
+    GradeToStartApplyingEffect: int = 0
+    PerGradeUpgradeInterval: int = 0
+    PerGradeUpgrade: Any = None
+    bOnlyAppliesToMaxGrade: bool = False
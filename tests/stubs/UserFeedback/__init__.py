@@ -0,0 +1,39 @@
+"""
+A stand-in for UserFeedback's boxes. Nothing is drawn, every box that gets shown is recorded in Shown instead.
+"""
+from typing import Any, List, Optional, Sequence
+
+Shown: List[Any] = []
+
+
+class TrainingBox:
+    def __init__(self, Title: str = "", Message: str = "", **kwargs: Any) -> None:
+        self.Title: str = Title
+        self.Message: str = Message
+        self.OnExit: Any = None
+
+    def Show(self) -> None:
+        Shown.append(self)
+
+
+class OptionBoxButton:
+    def __init__(self, Name: str, Tip: str = "") -> None:
+        self.Name: str = Name
+        self.Tip: str = Tip
+
+
+class OptionBox:
+    def __init__(self, Title: str = "", Caption: str = "", Buttons: Sequence[OptionBoxButton] = (),
+                 Tooltip: str = "", **kwargs: Any) -> None:
+        self.Title: str = Title
+        self.Caption: str = Caption
+        self.Buttons: Sequence[OptionBoxButton] = Buttons
+        self.Tooltip: str = Tooltip
+        self.Selected: Optional[OptionBoxButton] = None
+
+    def Show(self, Button: Optional[OptionBoxButton] = None) -> None:
+        self.Selected = Button
+        Shown.append(self)
+
+    def Hide(self) -> None:
+        pass
@@ -0,0 +1,80 @@
+"""
+A stand-in for the SDK's native unrealsdk module, just enough of it for the mods to import and run their logic
+outside of the game. Objects are plain attribute bags, lookups go through the Objects registry.
+"""
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class UClass:
+    def __init__(self, name: str) -> None:
+        self.Name: str = name
+
+
+class UObject:
+    def __init__(self, className: str = "Object", name: str = "", **attributes: Any) -> None:
+        self.Class: UClass = UClass(className)
+        self.Name: str = name
+        self.ObjectFlags: SimpleNamespace = SimpleNamespace(A=0, B=0)
+        self.__dict__.update(attributes)
+
+    def IsA(self, className: str) -> bool:
+        return self.Class.Name == className
+
+    def PathName(self, obj: "UObject") -> str:
+        return obj.Name
+
+    def __repr__(self) -> str:
+        return f"{self.Class.Name}'{self.Name}'"
+
+
+class FStruct(SimpleNamespace):
+    pass
+
+
+class UFunction:
+    pass
+
+
+Objects: Dict[str, Any] = {}
+Hooks: Dict[Tuple[str, str], Callable[..., Any]] = {}
+LoadedPackages: List[str] = []
+Logs: List[str] = []
+WorldInfo: UObject = UObject("WorldInfo", ControllerList=None)
+Engine: SimpleNamespace = SimpleNamespace(GamePlayers=[], GetCurrentWorldInfo=lambda: WorldInfo)
+
+
+def FindObject(className: str, path: str) -> Optional[Any]:
+    return Objects.get(path)
+
+
+def LoadPackage(package: str) -> None:
+    LoadedPackages.append(package)
+
+
+def KeepAlive(obj: Any) -> None:
+    pass
+
+
+def ConstructObject(Class: str, Outer: Any = None, Name: str = "", Template: Any = None) -> UObject:
+    obj = UObject(Class, Name)
+    if Template is not None:
+        obj.__dict__.update({key: value for key, value in vars(Template).items() if key not in ("Class", "Name")})
+    obj.Outer = Outer
+    return obj
+
+
+def GetEngine() -> SimpleNamespace:
+    return Engine
+
+
+def Log(message: str) -> None:
+    Logs.append(message)
+
+
+def RunHook(target: str, name: str, func: Callable[..., Any]) -> None:
+    Hooks[(target, name)] = func
+
+
+def RemoveHook(target: str, name: str) -> None:
+    Hooks.pop((target, name), None)
@@ -0,0 +1,13 @@
+from typing import Any
+
+import item_graphs
+from benchmark_salvage import Safeguards, Stages, run_benchmark
+
+
+def test_benchmark_covers_every_class_safeguard_and_stage(shown: list) -> None:
+    report: Any = run_benchmark(poolSizes=(10,), runs=1)
+    assert {(result["class"], result["safeguard"], result["stage"]) for result in report["results"]} == {
+        (className, safeguard, stage)
+        for className in item_graphs.ItemClasses for safeguard in Safeguards for stage in Stages
+    }
+    assert all(result["runs"] == 1 and result["poolSize"] == 10 for result in report["results"])
@@ -0,0 +1,275 @@
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+
+import item_graphs
+import pytest
+import unrealsdk
+from harness import load_mod
+from unrealsdk import FStruct, UObject
+
+
+class Canvas:
+    def __init__(self) -> None:
+        self.SizeX: int = 1920
+        self.SizeY: int = 1080
+        self.Font: Any = None
+        self.Drawn: List[str] = []
+
+    def SetPos(self, x: float, y: float, z: float) -> None:
+        pass
+
+    def SetDrawColorStruct(self, colour: Any) -> None:
+        pass
+
+    def DrawText(self, text: str, cr: bool, scaleX: float, scaleY: float) -> None:
+        self.Drawn.append(text)
+
+
+def make_attribute(value: float) -> UObject:
+    return UObject("AttributeDefinition", GetValue=lambda context: (value, None))
+
+
+@pytest.fixture
+def timer_mod(engine: Any) -> Iterator[Any]:
+    unrealsdk.Objects.update({
+        "D_Attributes.ShieldResourcePool.ShieldOnIdleRegenerationDelay": make_attribute(2.),
+        "D_Attributes.ShieldResourcePool.ShieldCurrentValue": make_attribute(0.),
+        "D_Attributes.Shield.RoidMeleeDamage": make_attribute(0.),
+    })
+    PC = engine.GamePlayers[0].Actor
+    PC.GetHUDMovie = lambda: UObject("HUDMovie")
+    PC.bViewingThirdPersonMenu = False
+    PC.MyWillowPawn = UObject("WillowPlayerPawn", IsInjured=lambda: False, DrivenVehicle=None)
+
+    mod = load_mod("ShieldRechargeTimer")
+    for option in (*mod.instance.Options, *mod.instance.TextColour.Children, *mod.instance.TimerPos.Children):
+        option.CurrentValue = option.StartingValue
+    mod.instance.Enable()
+    yield mod
+    mod.instance.Disable()
+
+
+def change_option(instance: Any, option: Any, value: Any) -> None:
+    # Like the mod menu, the mod hears about the change before the option's value is updated
+    instance.ModOptionChanged(option, value)
+    option.CurrentValue = value
+
+
+def render(mod: Any) -> Canvas:
+    canvas = Canvas()
+    mod.onPostRenderRechargeTimer(None, None, SimpleNamespace(Canvas=canvas))
+    return canvas
+
+
+def damage(mod: Any, PC: Any, amount: float = 10.) -> None:
+    pawn = UObject("WillowPlayerPawn", Controller=PC, WorldInfo=PC.WorldInfo)
+    mod.RechargeTimerPlayerDamaged(pawn, None, SimpleNamespace(Damage=amount))
+
+
+class TestShieldRechargeTimer:
+    def test_enable_and_disable_register_and_remove_every_hook(self, timer_mod: Any) -> None:
+        assert set(unrealsdk.Hooks) == {(target, name) for target, name, _ in timer_mod.TimerHooks}
+        timer_mod.instance.Disable()
+        assert unrealsdk.Hooks == {}
+        timer_mod.instance.Enable()
+
+    def test_layout_sliders_update_the_layout(self, timer_mod: Any) -> None:
+        instance = timer_mod.instance
+        change_option(instance, instance.xPosSlider, 250)
+        change_option(instance, instance.SizeSlider, 200)
+        assert instance.TimerLayout == (0.25, instance.yPosSlider.CurrentValue / 1000, 2.)
+
+    def test_dragging_commits_to_the_sliders_on_release(self, timer_mod: Any) -> None:
+        instance = timer_mod.instance
+        startX = instance.xPosSlider.CurrentValue
+        instance.dragTimer("Right", (1, 0, 0), 0)
+        instance.dragTimer("Right", (1, 0, 0), 2)
+        assert instance.xPosSlider.CurrentValue == startX
+        instance.dragTimer("Right", (1, 0, 0), 1)
+        assert instance.xPosSlider.CurrentValue == startX + 2
+        assert instance.DragOffset == [0, 0, 0]
+
+    def test_timer_counts_down_after_damage(self, timer_mod: Any, engine: Any) -> None:
+        PC = engine.GamePlayers[0].Actor
+        render(timer_mod)
+        damage(timer_mod, PC)
+        assert render(timer_mod).Drawn == ["2.0"]
+
+        PC.WorldInfo.TimeSeconds = 1.55
+        assert render(timer_mod).Drawn == ["0.5"]
+
+        PC.WorldInfo.TimeSeconds = 2.
+        assert render(timer_mod).Drawn == []
+        assert not timer_mod.instance.TimerActive
+
+    def test_timer_hides_behind_third_person_menus(self, timer_mod: Any, engine: Any) -> None:
+        PC = engine.GamePlayers[0].Actor
+        render(timer_mod)
+        damage(timer_mod, PC)
+        assert render(timer_mod).Drawn == ["2.0"]
+
+        PC.bViewingThirdPersonMenu = True
+        PC.GFxUIManager = UObject("GFxUIManager", IsMoviePlaying=lambda movie: False)
+        PC.PauseMenuDefinition = None
+        assert render(timer_mod).Drawn == []
+
+    def test_timer_stops_when_its_controller_is_replaced(self, timer_mod: Any, engine: Any) -> None:
+        oldPC = engine.GamePlayers[0].Actor
+        render(timer_mod)
+        damage(timer_mod, oldPC)
+
+        engine.GamePlayers[0].Actor = UObject("WillowPlayerController", WorldInfo=None)
+        assert render(timer_mod).Drawn == []
+        assert timer_mod.instance.LocalPlayersChanged
+
+        render(timer_mod)
+        assert oldPC not in timer_mod.instance.PlayerTimers
+        assert engine.GamePlayers[0].Actor in timer_mod.instance.PlayerTimers
+        assert not timer_mod.instance.TimerActive
+        assert not any(timer.TimerActive for timer in timer_mod.instance.PlayerTimers.values())
+
+    def test_timer_follows_its_player_when_an_earlier_player_leaves(self, timer_mod: Any, engine: Any) -> None:
+        secondPlayer = item_graphs.make_local_player()
+        PC = secondPlayer.Actor
+        PC.GetHUDMovie = lambda: UObject("HUDMovie")
+        PC.bViewingThirdPersonMenu = False
+        PC.MyWillowPawn = UObject("WillowPlayerPawn", IsInjured=lambda: False, DrivenVehicle=None)
+        engine.GamePlayers.append(secondPlayer)
+        render(timer_mod)
+        assert timer_mod.instance.PlayerTimers[PC].PlayerIndex == 1
+
+        engine.GamePlayers.pop(0)
+        timer_mod.RechargeTimerPlayersChanged(None, None, None)
+        render(timer_mod)
+        assert timer_mod.instance.PlayerTimers[PC].PlayerIndex == 0
+
+        for _ in range(2):
+            damage(timer_mod, PC)
+            assert render(timer_mod).Drawn == ["2.0"]
+
+    @pytest.mark.parametrize("filterOption", ("OnlyWithRoidShield", "OnlyWhenDepleted"))
+    def test_history_records_cycles_the_timer_hides(
+        self, timer_mod: Any, engine: Any, monkeypatch: Any, tmp_path: Any, filterOption: str
+    ) -> None:
+        instance = timer_mod.instance
+        monkeypatch.setattr(instance, "History", timer_mod.RechargeHistory(str(tmp_path / "history.csv")))
+        monkeypatch.setattr(instance, "ShieldCurValue", make_attribute(50.))
+        getattr(instance, filterOption).CurrentValue = True
+        instance.RecordHistory.CurrentValue = True
+        PC = engine.GamePlayers[0].Actor
+        render(timer_mod)
+
+        damage(timer_mod, PC)
+        PC.WorldInfo.TimeSeconds = 1.
+        damage(timer_mod, PC)
+        assert render(timer_mod).Drawn == []
+
+        PC.WorldInfo.TimeSeconds = 3.05
+        render(timer_mod)
+        assert list(instance.History.Cycles) == [(0, 0., 3., 2., 10., 50., 0)]
+        assert not instance.TimerActive
+
+    def test_loading_stops_every_timer(self, timer_mod: Any, engine: Any) -> None:
+        render(timer_mod)
+        damage(timer_mod, engine.GamePlayers[0].Actor)
+        timer_mod.RechargeTimerLoadingStarted(None, None, None)
+        assert not timer_mod.instance.TimerActive
+        assert timer_mod.instance.LocalPlayersChanged
+
+
+class TestMeleeEnhancement:
+    def test_enable_preloads_and_disable_restores(self, engine: Any) -> None:
+        mod = load_mod("MeleeEnhancement")
+        kunai = UObject("Behavior_SpawnProjectile", bInflictRadiusDamageOnOwner=True)
+        unrealsdk.Objects[
+            "GD_Assassin_Skills.ActionSkill.Skill_Stealth:BehaviorProviderDefinition_0.Behavior_SpawnProjectile_0"
+        ] = kunai
+        mod.instance.Enable()
+        assert "GD_Lilac_Psycho_Streaming_SF" in unrealsdk.LoadedPackages
+
+        PC = engine.GamePlayers[0].Actor
+        PC.PlayerClass = FStruct(CharacterNameId=FStruct(CharacterClassId=FStruct(ClassName="Assassin")))
+        for _ in range(2):
+            mod.instance.InjectSkillChanges(UObject("PlayerSkillTree", Outer=PC), None, None)
+        assert kunai.bInflictRadiusDamageOnOwner is False
+
+        mod.instance.Disable()
+        assert kunai.bInflictRadiusDamageOnOwner is True
+        assert not any(log.endswith(" ms") for log in unrealsdk.Logs)
+
+    def test_timings_are_only_logged_while_profiling(self, engine: Any) -> None:
+        mod = load_mod("MeleeEnhancement")
+        patches = mod.PatchEngine(mod.SkillPatches, mod.PatchPackages)
+        patches.Preload()
+        assert "Preload" in patches.Timings
+        assert not any(log.endswith(" ms") for log in unrealsdk.Logs)
+
+        profiler = load_mod("HookProfiler")
+        profiler.instance.Enable()
+        try:
+            patches.Preload()
+        finally:
+            profiler.instance.Disable()
+        assert unrealsdk.Logs[-1].startswith("[Melee Enhancement] Preloaded")
+
+    def test_patches_with_missing_refs_are_skipped(self, engine: Any, monkeypatch: Any) -> None:
+        mod = load_mod("MeleeEnhancement")
+        explode = UObject("Behavior_Explode", InstigatorSelfDamageScale=0.9, Definition=None)
+        monkeypatch.setitem(
+            unrealsdk.Objects,
+            "GD_Lilac_SkillsBase.Buzzaxe.Projectile_Buzzaxe:BehaviorProviderDefinition_0.Behavior_Explode_6",
+            explode
+        )
+        patches = mod.PatchEngine(mod.SkillPatches, mod.PatchPackages)
+        PC = engine.GamePlayers[0].Actor
+        for _ in range(2):
+            patches.Apply("Psycho", PC)
+        assert explode.InstigatorSelfDamageScale == pytest.approx(0.3)
+        assert explode.Definition is None
+        assert any("GD_Explosions.Slag.Explosion_SlagMaster" in log for log in unrealsdk.Logs)
+
+        patches.Restore(None, None)
+        assert explode.InstigatorSelfDamageScale == 0.9
+
+    def test_host_keeps_a_remote_players_patches(self, engine: Any, monkeypatch: Any) -> None:
+        mod = load_mod("MeleeEnhancement")
+        explode = UObject("Behavior_Explode", InstigatorSelfDamageScale=0.9, Definition=None)
+        monkeypatch.setitem(
+            unrealsdk.Objects,
+            "GD_Lilac_SkillsBase.Buzzaxe.Projectile_Buzzaxe:BehaviorProviderDefinition_0.Behavior_Explode_6",
+            explode
+        )
+        hostPC = engine.GamePlayers[0].Actor
+        hostPC.PlayerClass = FStruct(CharacterNameId=FStruct(CharacterClassId=FStruct(ClassName="Assassin")))
+        remotePC = UObject(
+            "WillowPlayerController",
+            PlayerClass=FStruct(CharacterNameId=FStruct(CharacterClassId=FStruct(ClassName="Psycho"))),
+            NextController=None,
+        )
+        hostPC.NextController = remotePC
+        try:
+            mod.instance.InjectSkillChanges(UObject("PlayerSkillTree", Outer=remotePC), None, None)
+            for _ in range(2):
+                mod.instance.InjectSkillChanges(UObject("PlayerSkillTree", Outer=hostPC), None, None)
+                assert explode.InstigatorSelfDamageScale == pytest.approx(0.3)
+
+            hostPC.NextController = None
+            mod.instance.InjectSkillChanges(UObject("PlayerSkillTree", Outer=hostPC), None, None)
+            assert explode.InstigatorSelfDamageScale == 0.9
+        finally:
+            mod.instance.Disable()
+
+
+class TestHookProfiler:
+    def test_profiles_only_while_enabled(self) -> None:
+        mod = load_mod("HookProfiler")
+        hook = mod.profile_hook("Tests.hook")(lambda: True)
+        hook()
+        assert "Tests.hook" not in mod.Stats
+
+        mod.instance.Enable()
+        try:
+            hook()
+        finally:
+            mod.instance.Disable()
+        assert mod.Stats.pop("Tests.hook").Calls == 1
@@ -0,0 +1,251 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from item_graphs import Balance, ItemClasses, ItemLayouts, make_inventory_panel, make_item, make_part
+
+
+def swapped_attributes(swappableParts: list) -> list:
+    return [parts[2] for parts in swappableParts]
+
+
+def press(spare_parts: Any, panel: Any, key: str, event: int = 0) -> bool:
+    return spare_parts._equipInputKey(panel, None, SimpleNamespace(ukey=key, uevent=event))
+
+
+class TestFindParts:
+    @pytest.mark.parametrize("className", ItemClasses)
+    def test_identical_items_only_offer_duplicates(self, spare_parts: Any, className: str) -> None:
+        balance = Balance(className)
+        first, second = make_item(balance), make_item(balance)
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            className, first.DefinitionData, second.DefinitionData, "Safe"
+        )
+        assert swappable and all(parts[0] is parts[1] for parts in swappable)
+        assert incompatible == []
+
+    @pytest.mark.parametrize("className, safeguard, expected", [
+        ("WillowWeapon", "Safe", [attribute for attribute, _ in ItemLayouts["WillowWeapon"][1][:8]]),
+        ("WillowWeapon", "Insane", [attribute for attribute, _ in ItemLayouts["WillowWeapon"][1]]),
+        ("WillowShield", "Insane", ["AlphaItemPartDefinition", "BetaItemPartDefinition",
+                                    "GammaItemPartDefinition", "DeltaItemPartDefinition"]),
+        ("WillowArtifact", "Safe", ["ThetaItemPartDefinition"]),
+        ("WillowArtifact", "Expert", [attribute for attribute, _ in ItemLayouts["WillowArtifact"][1][:8]]),
+        ("WillowClassMod", "Safe", [attribute for attribute, _ in ItemLayouts["WillowClassMod"][1][1:]]),
+        ("WillowGrenadeMod", "Safe", [attribute for attribute, _ in ItemLayouts["WillowGrenadeMod"][1][:8]]),
+    ])
+    def test_safeguard_limits_salvageable_slots(
+        self, spare_parts: Any, className: str, safeguard: str, expected: list
+    ) -> None:
+        balance = Balance(className)
+        first, second = make_item(balance, balance.parts(0)), make_item(balance, balance.parts(1))
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            className, first.DefinitionData, second.DefinitionData, safeguard
+        )
+        assert swapped_attributes(swappable) == expected
+        assert incompatible == []
+
+    @pytest.mark.parametrize("className", ItemClasses)
+    def test_parts_outside_the_balance_are_incompatible(self, spare_parts: Any, className: str) -> None:
+        balance = Balance(className)
+        attribute = ItemLayouts[className][1][-2][0]
+        foreignPart = make_part("Foreign")
+        first = make_item(balance)
+        second = make_item(balance, {**balance.parts(1), attribute: foreignPart})
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            className, first.DefinitionData, second.DefinitionData, "Expert"
+        )
+        assert attribute not in swapped_attributes(swappable)
+        if className == "WillowShield":
+            # Shields never salvage past their Delta slot, so the foreign part isn't even looked at
+            assert incompatible == []
+        else:
+            assert incompatible == [foreignPart]
+
+    def test_weapon_part_missing_from_first_item_is_incompatible(self, spare_parts: Any) -> None:
+        balance = Balance("WillowWeapon")
+        first = make_item(balance, {**balance.parts(0), "ElementalPartDefinition": None})
+        second = make_item(balance, balance.parts(1))
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            "WillowWeapon", first.DefinitionData, second.DefinitionData, "Safe"
+        )
+        assert "ElementalPartDefinition" not in swapped_attributes(swappable)
+        assert incompatible == [balance.part("ElementalPartDefinition", 1)]
+
+    def test_insane_weapons_accept_any_part_of_the_same_weapon_type(self, spare_parts: Any) -> None:
+        firstBalance, secondBalance = Balance("WillowWeapon"), Balance("WillowWeapon")
+        first = make_item(firstBalance, {**firstBalance.parts(0), "ElementalPartDefinition": None}, weaponType=2)
+        second = make_item(secondBalance, weaponType=2)
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            "WillowWeapon", first.DefinitionData, second.DefinitionData, "Insane"
+        )
+        assert len(swappable) == 9
+        assert incompatible == []
+
+        other = make_item(secondBalance, weaponType=3)
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            "WillowWeapon", first.DefinitionData, other.DefinitionData, "Insane"
+        )
+        assert swappable == []
+        assert len(incompatible) == 9
+
+    def test_shields_without_beta_parts_read_their_part_list_collection(self, spare_parts: Any) -> None:
+        balance = Balance("WillowShield", reroutedShield=True)
+        first, second = make_item(balance, balance.parts(0)), make_item(balance, balance.parts(1))
+        swappable, incompatible = spare_parts.UserInterface.findParts(
+            "WillowShield", first.DefinitionData, second.DefinitionData, "Safe"
+        )
+        assert len(swappable) == 4
+        assert incompatible == []
+
+    def test_unknown_item_class_has_no_parts(self, spare_parts: Any) -> None:
+        balance = Balance("WillowShield")
+        first = make_item(balance)
+        assert spare_parts.UserInterface.findParts(
+            "WillowMissionItem", first.DefinitionData, first.DefinitionData, "Safe"
+        ) == ([], [])
+
+    def test_part_pools_are_indexed_once_per_balance(self, spare_parts: Any) -> None:
+        balance = Balance("WillowGrenadeMod")
+        first = make_item(balance)
+        for index in (1, 2):
+            spare_parts.UserInterface.findParts(
+                "WillowGrenadeMod", first.DefinitionData, make_item(balance, balance.parts(index)).DefinitionData,
+                "Safe"
+            )
+        assert len(spare_parts.UserInterface.partIndex) == 8
+        spare_parts._onMapLoaded(None, None, None)
+        assert spare_parts.UserInterface.partIndex == {}
+
+
+class TestSafeguardBlock:
+    def test_strict_uniques_blocks_other_balances(self, spare_parts: Any) -> None:
+        first = make_item(Balance("WillowShield"), rarityLevel=7)
+        second = make_item(Balance("WillowShield"), rarityLevel=7)
+        assert spare_parts.getSafeguardBlock(first, second, first.DefinitionData, second.DefinitionData) \
+            == "StrictUniques"
+
+        spare_parts.StrictUniques.CurrentValue = False
+        assert spare_parts.getSafeguardBlock(first, second, first.DefinitionData, second.DefinitionData) == ""
+
+    def test_strict_uniques_allows_the_same_unique(self, spare_parts: Any) -> None:
+        balance = Balance("WillowWeapon")
+        first, second = make_item(balance, rarityLevel=7), make_item(balance, rarityLevel=7)
+        assert spare_parts.getSafeguardBlock(first, second, first.DefinitionData, second.DefinitionData) == ""
+
+    def test_strict_uniques_skips_class_mods(self, spare_parts: Any) -> None:
+        first = make_item(Balance("WillowClassMod"), rarityLevel=7)
+        second = make_item(Balance("WillowClassMod"), rarityLevel=7)
+        assert spare_parts.getSafeguardBlock(first, second, first.DefinitionData, second.DefinitionData) == ""
+
+    def test_rarity_lock_blocks_lower_rarities(self, spare_parts: Any) -> None:
+        balance = Balance("WillowGrenadeMod")
+        first, second = make_item(balance, rarityLevel=4), make_item(balance, rarityLevel=3)
+        assert spare_parts.getSafeguardBlock(first, second, first.DefinitionData, second.DefinitionData) \
+            == "RarityLock"
+        assert spare_parts.getSafeguardBlock(second, first, second.DefinitionData, first.DefinitionData) == ""
+
+        spare_parts.RarityLock.CurrentValue = False
+        assert spare_parts.getSafeguardBlock(first, second, first.DefinitionData, second.DefinitionData) == ""
+
+    def test_seraph_rarity_level_500_is_read_as_501(self, spare_parts: Any) -> None:
+        assert spare_parts.getRarity(500) == spare_parts.getRarity(501) == 6
+
+
+class TestFindSalvageDonors:
+    def test_donors_are_sorted_by_salvageable_part_count(self, spare_parts: Any) -> None:
+        balance = Balance("WillowGrenadeMod")
+        first = make_item(balance)
+        oneDifferent = make_item(balance, {**balance.parts(0), "AlphaItemPartDefinition": balance.part(
+            "AlphaItemPartDefinition", 1
+        )})
+        allDifferent = make_item(balance, balance.parts(1))
+        identical = make_item(balance)
+        backpack = [None, first, oneDifferent, identical, allDifferent]
+        assert spare_parts.UserInterface.findSalvageDonors(first, backpack) == [(allDifferent, 8), (oneDifferent, 1)]
+
+    def test_donors_skip_other_classes_and_blocked_items(self, spare_parts: Any) -> None:
+        balance = Balance("WillowArtifact")
+        first = make_item(balance, rarityLevel=4)
+        lowerRarity = make_item(balance, balance.parts(1), rarityLevel=3)
+        otherClass = make_item(Balance("WillowGrenadeMod"), rarityLevel=4)
+        assert spare_parts.UserInterface.findSalvageDonors(first, [lowerRarity, otherClass]) == []
+
+    def test_class_mod_donors_must_match_player_class(self, spare_parts: Any) -> None:
+        balance = Balance("WillowClassMod")
+        first = make_item(balance, requiredClass="Assassin")
+        sameClass = make_item(balance, balance.parts(1), requiredClass="Assassin")
+        otherClass = make_item(balance, balance.parts(1), requiredClass="Psycho")
+        assert spare_parts.UserInterface.findSalvageDonors(first, [sameClass, otherClass]) == [(sameClass, 8)]
+
+        spare_parts.SanityCheckSafeguard.CurrentValue = "Insane"
+        assert len(spare_parts.UserInterface.findSalvageDonors(first, [sameClass, otherClass])) == 2
+
+
+class TestEquipInputKey:
+    def test_ignores_anything_but_key_presses(self, spare_parts: Any, shown: list) -> None:
+        balance = Balance("WillowShield")
+        panel = make_inventory_panel(make_item(balance), make_item(balance, balance.parts(1)))
+        assert press(spare_parts, panel, "C", event=1) is True
+        assert shown == []
+
+    @pytest.mark.parametrize("attribute, value", [("bInitialSetupFinished", False), ("bInEquippedView", True)])
+    def test_ignores_panels_that_arent_comparing(
+        self, spare_parts: Any, shown: list, attribute: str, value: bool
+    ) -> None:
+        balance = Balance("WillowShield")
+        panel = make_inventory_panel(make_item(balance), make_item(balance, balance.parts(1)))
+        setattr(panel, attribute, value)
+        assert press(spare_parts, panel, "C") is True
+        assert shown == []
+
+    def test_ignores_other_keys(self, spare_parts: Any, shown: list) -> None:
+        balance = Balance("WillowShield")
+        panel = make_inventory_panel(make_item(balance), make_item(balance, balance.parts(1)))
+        assert press(spare_parts, panel, "Enter") is True
+        assert shown == []
+
+    def test_needs_a_selected_item(self, spare_parts: Any, shown: list) -> None:
+        panel = make_inventory_panel(make_item(Balance("WillowShield")), None)
+        assert press(spare_parts, panel, "C") is True
+        assert shown == []
+
+    def test_same_item_is_ignored(self, spare_parts: Any, shown: list) -> None:
+        item = make_item(Balance("WillowShield"))
+        assert press(spare_parts, make_inventory_panel(item, item), "C") is True
+        assert shown == []
+
+    @pytest.mark.parametrize("className", ["WillowWeapon", "WillowShield"])
+    def test_equipped_items_cant_be_salvaged_onto(self, spare_parts: Any, shown: list, className: str) -> None:
+        balance = Balance(className)
+        panel = make_inventory_panel(make_item(balance, equipped=True), make_item(balance, balance.parts(1)))
+        assert press(spare_parts, panel, "C") is True
+        assert [box.Title for box in shown] == ["<font color=\"#dc4646\">Equipped Item</font>"]
+
+    def test_strict_uniques_popup(self, spare_parts: Any, shown: list) -> None:
+        panel = make_inventory_panel(
+            make_item(Balance("WillowShield"), rarityLevel=7), make_item(Balance("WillowShield"), rarityLevel=7)
+        )
+        assert press(spare_parts, panel, "C") is False
+        assert [box.Title for box in shown] == ["<font color=\"#dc4646\">Strict Uniques</font>"]
+
+    def test_rarity_lock_popup(self, spare_parts: Any, shown: list) -> None:
+        balance = Balance("WillowShield")
+        panel = make_inventory_panel(make_item(balance, rarityLevel=4), make_item(balance, balance.parts(1)))
+        assert press(spare_parts, panel, "C") is False
+        assert [box.Title for box in shown] == ["<font color='#dc4646'>Rarity Lock</font>"]
+
+    def test_salvage_opens_found_parts(self, spare_parts: Any, shown: list) -> None:
+        balance = Balance("WillowShield")
+        first, second = make_item(balance), make_item(balance, balance.parts(1))
+        assert press(spare_parts, make_inventory_panel(first, second), "C") is False
+        assert [box.Title for box in shown] == ["Found Parts [Safe Mode]"]
+        assert spare_parts.UserInterface.firstItem is first
+        assert len(spare_parts.UserInterface.swappableParts) == 4
+
+    def test_donor_scan_lists_backpack_donors(self, spare_parts: Any, engine: Any, shown: list) -> None:
+        balance = Balance("WillowShield")
+        first, donor = make_item(balance), make_item(balance, balance.parts(1))
+        engine.GamePlayers[0].Actor.GetPawnInventoryManager().Backpack[:] = [first, donor]
+        assert press(spare_parts, make_inventory_panel(None, first), "V") is False
+        assert len(shown) == 1 and donor.Name in shown[0].Message